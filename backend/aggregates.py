@@ -0,0 +1,169 @@
+"""
+aggregates.py
+-------------
+Precomputed dashboard / trends aggregates for the cached job list.
+
+The title, company and skill counters are maintained once per job cache
+refresh (see JobCache.add_listener), so /dashboard and the legacy trends
+view read a ready-made snapshot instead of recounting every job per request.
+When the cache is refreshed, only the jobs that were inserted or removed
+are applied to the counters.
+"""
+
+import threading
+from collections import Counter
+
+from jobscraper import get_jobs, job_cache
+from skills import skill_registry
+from utils import job_key
+
+TOP_N = 5
+
+
+def _top(counts) -> list:
+    """
+    The TOP_N (key, count) pairs, highest count first and ties by key, so
+    the order does not depend on the order keys were counted in.
+    """
+    return sorted(counts, key=lambda kv: (-kv[1], kv[0]))[:TOP_N]
+
+
+def _decrement(counter: Counter, key) -> None:
+    """Decrement a count, dropping the key at zero so the views stay clean."""
+    if counter[key] <= 1:
+        del counter[key]
+    else:
+        counter[key] -= 1
+
+
+class JobAggregates:
+    """
+    Title, company and skill counters over a set of jobs, plus cached
+    top-N views derived from them.
+    """
+
+    def __init__(self, jobs: list = ()):
+        self.titles = Counter()
+        self.companies = Counter()
+        self.skills = Counter()     # skill id -> count
+        self.jobs = []
+        self._by_key = {}
+        self._views = None
+        self.replace(list(jobs))
+
+    # ──────────────────────────────────────────────
+    # Incremental updates
+    # ──────────────────────────────────────────────
+    def add(self, job: dict) -> None:
+        """Count one job."""
+        title = job.get('title')
+        if title:
+            self.titles[title] += 1
+        company = job.get('company')
+        if company:
+            self.companies[company] += 1
+        for skill_id in skill_registry.intern_all(job.get('skills', [])):
+            self.skills[skill_id] += 1
+        self._views = None
+
+    def remove(self, job: dict) -> None:
+        """Uncount a job previously passed to add()."""
+        title = job.get('title')
+        if title:
+            _decrement(self.titles, title)
+        company = job.get('company')
+        if company:
+            _decrement(self.companies, company)
+        for skill_id in skill_registry.intern_all(job.get('skills', [])):
+            _decrement(self.skills, skill_id)
+        self._views = None
+
+    def replace(self, jobs: list) -> int:
+        """
+        Move the counters to a new job list by applying only the jobs whose
+        title+company key appeared, disappeared or whose content changed.
+
+        Returns:
+            Number of add/remove operations applied.
+        """
+        new_by_key = {}
+        for job in jobs:
+            new_by_key.setdefault(job_key(job), job)
+
+        changes = 0
+        for key, old_job in self._by_key.items():
+            new_job = new_by_key.get(key)
+            if new_job is None or (new_job is not old_job and new_job != old_job):
+                self.remove(old_job)
+                changes += 1
+        for key, new_job in new_by_key.items():
+            old_job = self._by_key.get(key)
+            if old_job is None or (new_job is not old_job and new_job != old_job):
+                self.add(new_job)
+                changes += 1
+
+        self._by_key = new_by_key
+        self.jobs = jobs
+        self._views = None
+        return changes
+
+    # ──────────────────────────────────────────────
+    # Read views
+    # ──────────────────────────────────────────────
+    def _build_views(self) -> dict:
+        titles = _top(self.titles.items())
+        companies = _top(self.companies.items())
+        skills = _top((skill_registry.name(skill_id), count) for skill_id, count in self.skills.items())
+        return {
+            "quick_stats": {
+                "total_jobs": len(self.jobs),
+                "top_skill": skills[0][0] if skills else "N/A",
+                "top_company": companies[0][0] if companies else "N/A",
+                "top_role": titles[0][0] if titles else "N/A",
+            },
+            "trending_jobs": [{"title": title, "count": count} for title, count in titles],
+            "hiring_companies": [{"name": name, "jobs": count} for name, count in companies],
+            "demanding_skills": [{"skill": skill, "count": count} for skill, count in skills],
+            # Scraped jobs are newest first, so the first 5 are the most recent
+            "recent_jobs": [
+                {
+                    "title": job.get("title", "Unknown"),
+                    "company": job.get("company", "Unknown"),
+                    "location": job.get("location", "Unknown"),
+                }
+                for job in self.jobs[:TOP_N]
+            ],
+        }
+
+    def views(self) -> dict:
+        """Dashboard-shaped dict of the current aggregates (cached)."""
+        views = self._views
+        if views is None:
+            views = self._views = self._build_views()
+        return views
+
+
+_aggregates = JobAggregates()
+_aggregates_lock = threading.Lock()
+
+
+def _apply_snapshot(jobs: list) -> None:
+    with _aggregates_lock:
+        if _aggregates.jobs is not jobs:
+            _aggregates.replace(jobs)
+            _aggregates.views()
+
+
+def get_aggregates() -> dict:
+    """
+    Return the aggregate views for the current job snapshot, catching up if
+    the cache was refreshed before the listener ran.
+    """
+    jobs = get_jobs()
+    if _aggregates.jobs is not jobs:
+        _apply_snapshot(jobs)
+    with _aggregates_lock:
+        return _aggregates.views()
+
+
+job_cache.add_listener(_apply_snapshot)
@@ -1,17 +1,68 @@
-from flask import Flask, jsonify, request
+import threading
+import time
+from flask import Flask, Response, g, jsonify, request, stream_with_context
 from flask_cors import CORS
-from jobscraper import get_jobs
-from career import career_paths
+from jobscraper import get_jobs, job_cache, warm_start
+from career import career_paths, career_paths_batch, rank_careers
 from trends import get_trends
 from dashboard import get_dashboard
-from resume_match import match_resume
-from verifyjob import verify
-from resume_upload import extract_text, extract_skills, match_jobs
+from aggregates import get_aggregates
+from resume_match import match_resume, match_resume_batch
+from verifyjob import verify, verify_batch
+from resume_upload import MAX_BATCH_BYTES, analyze_resume, expand_uploads, screen_resumes
+from resume_parser import ParserBusyError, ParseTimeoutError
+from jobindex import DEFAULT_PAGE_SIZE, SCORING_MODES, search_jobs
+from response_cache import dumps, json_response, serialized
+from retrieval import rank_jobs
+from jobstore import get_store
+from metrics import CONTENT_TYPE, HTTP_REQUEST_DURATION, HTTP_REQUESTS, JOB_CACHE_REQUESTS, render
 
 # Initialize the Flask application
 app = Flask(__name__)
+# Reject oversized request bodies (413) before they are read into memory
+app.config['MAX_CONTENT_LENGTH'] = MAX_BATCH_BYTES
 # Enable CORS for all routes and origins
 CORS(app)
+# Serve the last stored job snapshot right away; live sources refresh in the background.
+# Runs on the first request rather than at import, so importing this module (tests,
+# tools, resume parser workers, the debug reloader's watcher process) never scrapes.
+_warm_start_lock = threading.Lock()
+_warm_started = False
+
+@app.before_request
+def _warm_start_once():
+    global _warm_started
+    if not _warm_started:
+        with _warm_start_lock:
+            if not _warm_started:
+                warm_start()
+                _warm_started = True
+
+# Routes answered from the cached job snapshot; each request counts once in
+# careerai_job_cache_requests_total, however many times it reads the cache
+JOB_CACHE_ENDPOINTS = frozenset({
+    'api_jobs', 'api_dashboard', 'api_resume', 'api_resume_batch',
+    'upload_resume', 'upload_resumes', 'api_jobs_rank',
+})
+
+@app.before_request
+def _count_job_cache_request():
+    if request.endpoint in JOB_CACHE_ENDPOINTS:
+        JOB_CACHE_REQUESTS.inc(job_cache.state)
+
+# Per-route latency and status metrics, keyed by the route template (see /metrics)
+@app.before_request
+def _start_timer():
+    g.started = time.perf_counter()
+
+@app.after_request
+def _record_request(response):
+    started = g.get('started')
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, request.method, route)
+        HTTP_REQUESTS.inc(request.method, route, str(response.status_code))
+    return response
 
 # -----------------------------------------------------------------------------
 # 1. HOME ROUTE
@@ -26,13 +77,56 @@ def home():
 # -----------------------------------------------------------------------------
 # 2. JOBS API
 # -----------------------------------------------------------------------------
+JOB_FILTER_PARAMS = ('skill', 'company', 'location', 'min_salary', 'max_risk', 'q', 'limit', 'cursor')
+
+def _number_arg(name, cast, default=None):
+    """Query parameter `name` parsed with `cast`; ValueError names the parameter."""
+    value = request.args.get(name)
+    if value is None or value.strip() == '':
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        kind = 'an integer' if cast is int else 'a number'
+        raise ValueError(f"'{name}' must be {kind}, got '{value}'.")
+    if number != number or number in (float('inf'), float('-inf')):
+        raise ValueError(f"'{name}' must be a finite number, got '{value}'.")
+    return number
+
 @app.route('/jobs', methods=['GET'])
 def api_jobs():
     """
     Returns real job listings scraped from public websites.
+    The body is serialized once per job snapshot and tagged with an ETag.
+
+    With any of these query parameters, returns one filtered page instead:
+      skill (repeatable or comma-separated), company, location,
+      min_salary, max_risk (0-1 fraud score), q (free text), limit, cursor
+    Output: JSON { jobs: [...], total: n, next_cursor: "..." | null }
     """
+    if any(name in request.args for name in JOB_FILTER_PARAMS):
+        skills = [s.strip() for value in request.args.getlist('skill') for s in value.split(',') if s.strip()]
+        try:
+            min_salary = _number_arg('min_salary', int)
+            max_risk = _number_arg('max_risk', float)
+            # Out-of-range limits are clamped to 1..MAX_PAGE_SIZE by search_jobs
+            limit = _number_arg('limit', int, DEFAULT_PAGE_SIZE)
+            page = search_jobs(
+                skills=skills,
+                company=request.args.get('company'),
+                location=request.args.get('location'),
+                min_salary=min_salary,
+                text=request.args.get('q'),
+                max_risk=max_risk,
+                cursor=request.args.get('cursor'),
+                limit=limit,
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify(page)
+
     jobs = get_jobs()
-    return jsonify(jobs)
+    return json_response(serialized('jobs', jobs))
 
 # -----------------------------------------------------------------------------
 # 3. CAREER PATH API
@@ -42,18 +136,48 @@ def api_career():
     """
     Returns career paths based on the input skill provided in the request body.
     Expects JSON: {"skill": "Java"}
+
+    Or, for a whole skill set, careers ranked by coverage with missing skills:
+    Expects JSON: {"skills": ["Java", "SQL", "Docker"]}
     """
     # Parse JSON data from the request
     data = request.get_json()
+
+    if data and isinstance(data.get('skills'), list):
+        if not all(isinstance(skill, str) for skill in data['skills']):
+            return jsonify({"error": "Every entry in 'skills' must be a string"}), 400
+        return jsonify(rank_careers(data['skills']))
     
     # Check if skill is in the dictionary
     if not data or 'skill' not in data:
-        return jsonify({"error": "Please provide a 'skill' in the JSON body"}), 400
+        return jsonify({"error": "Please provide a 'skill' or 'skills' in the JSON body"}), 400
         
     skill = data['skill']
     paths = career_paths(skill)
     return jsonify(paths)
 
+# Upper bound on queries per batch call (/career/batch, /resume/batch, /verifyjob/batch)
+MAX_BATCH_QUERIES = 1000
+
+@app.route('/career/batch', methods=['POST'])
+def api_career_batch():
+    """
+    Batch form of /career: answers many skills in one call.
+    Expects JSON: {"skills": ["Java", "Python", ...]}
+    Returns JSON: {"results": [<career_paths result>, ...]} in input order.
+    """
+    data = request.get_json(silent=True)
+
+    if not data or not isinstance(data.get('skills'), list):
+        return jsonify({"error": "Please provide a 'skills' list in the JSON body"}), 400
+    skills = data['skills']
+    if len(skills) > MAX_BATCH_QUERIES:
+        return jsonify({"error": f"At most {MAX_BATCH_QUERIES} skills per batch"}), 400
+    if not all(isinstance(skill, str) for skill in skills):
+        return jsonify({"error": "Every entry in 'skills' must be a string"}), 400
+
+    return jsonify({"results": career_paths_batch(skills)})
+
 # -----------------------------------------------------------------------------
 # 4. DASHBOARD API
 # -----------------------------------------------------------------------------
@@ -66,9 +190,11 @@ def api_dashboard():
     - Top Hiring Companies
     - Most Demanding Skills
     - Recent Jobs
+
+    The body is serialized once per aggregate snapshot and tagged with an ETag.
     """
-    data = get_dashboard()
-    return jsonify(data)
+    views = get_aggregates()
+    return json_response(serialized('dashboard', views, get_dashboard))
 
 # -----------------------------------------------------------------------------
 # 5. TRENDS DASHBOARD API (LEGACY)
@@ -90,6 +216,25 @@ def api_resume():
     matched = match_resume(skills)
     return jsonify(matched)
 
+@app.route('/resume/batch', methods=['POST'])
+def api_resume_batch():
+    """
+    Batch form of /resume: matches many skill lists against one job snapshot.
+    Expects JSON: {"queries": [["Java", "SQL"], ["Python"], ...]}
+    Returns JSON: {"results": [[<job>, ...], ...]} in input order.
+    """
+    data = request.get_json(silent=True)
+
+    if not data or not isinstance(data.get('queries'), list):
+        return jsonify({"error": "Please provide a 'queries' list in the JSON body"}), 400
+    queries = data['queries']
+    if len(queries) > MAX_BATCH_QUERIES:
+        return jsonify({"error": f"At most {MAX_BATCH_QUERIES} queries per batch"}), 400
+    if not all(isinstance(q, list) and all(isinstance(s, str) for s in q) for q in queries):
+        return jsonify({"error": "Every query must be a list of skill strings"}), 400
+
+    return jsonify({"results": match_resume_batch(queries)})
+
 # -----------------------------------------------------------------------------
 # 6. FAKE JOB DETECTION API
 # -----------------------------------------------------------------------------
@@ -110,6 +255,23 @@ def api_verifyjob():
     status = verify(email)
     return jsonify(status)
 
+@app.route('/verifyjob/batch', methods=['POST'])
+def api_verifyjob_batch():
+    """
+    Batch form of /verifyjob.
+    Expects JSON: {"emails": ["hr@company.com", "jobs@gmail.com", ...]}
+    Returns JSON: {"results": [<verify result>, ...]} in input order.
+    """
+    data = request.get_json(silent=True)
+
+    if not data or not isinstance(data.get('emails'), list):
+        return jsonify({"error": "Please provide an 'emails' list in the JSON body"}), 400
+    emails = data['emails']
+    if len(emails) > MAX_BATCH_QUERIES:
+        return jsonify({"error": f"At most {MAX_BATCH_QUERIES} emails per batch"}), 400
+
+    return jsonify({"results": verify_batch(emails)})
+
 # -----------------------------------------------------------------------------
 # 7. RESUME UPLOAD & JOB MATCHING API
 # -----------------------------------------------------------------------------
@@ -120,43 +282,172 @@ def upload_resume():
     then returns a list of matching jobs from the jobs database.
 
     Input:  multipart/form-data  →  file field named 'file'
-    Output: JSON { extracted_skills: [...], matching_jobs: [...] }
+            optional field/query 'scoring': overlap (default), jaccard, coverage
+            optional field/query 'ranking=text': also rank jobs by BM25 relevance
+            to the full resume text
+    Output: JSON { extracted_skills: [...], matching_jobs: [...], ranked_jobs: [...]? }
     """
     # Validate file presence
     if 'file' not in request.files:
         return jsonify({"error": "No file uploaded. Send a file with field name 'file'."}), 400
 
+    scoring = request.values.get('scoring', 'overlap')
+    if scoring not in SCORING_MODES:
+        return jsonify({"error": f"Unknown scoring mode '{scoring}'. Use one of: {', '.join(SCORING_MODES)}."}), 400
+
     file = request.files['file']
 
     if file.filename == '':
         return jsonify({"error": "File name is empty. Please select a valid file."}), 400
 
     try:
-        # Step 1: Extract text from resume
-        text = extract_text(file)
+        # Extract text, identify skills and match them against the jobs
+        # database (cached by file content, see resume_cache.py)
+        result = analyze_resume(file.filename, file.read(), scoring)
 
-        if not text.strip():
+        if not result["text"].strip():
             return jsonify({"error": "Could not extract any text from the file. Please check the file content."}), 422
 
-        # Step 2: Identify skills in the text
-        skills = extract_skills(text)
-
-        # Step 3: Match skills against jobs database
-        jobs = match_jobs(skills)
+        response = {
+            "extracted_skills": result["skills"],
+            "matching_jobs": result["jobs"]
+        }
+        if request.values.get('ranking') == 'text':
+            response["ranked_jobs"] = rank_jobs(result["text"])
 
-        return jsonify({
-            "extracted_skills": skills,
-            "matching_jobs": jobs
-        })
+        return jsonify(response)
 
     except ValueError as e:
         return jsonify({"error": str(e)}), 415
+    except ParserBusyError as e:
+        return jsonify({"error": str(e)}), 503, {"Retry-After": "2"}
+    except ParseTimeoutError as e:
+        return jsonify({"error": str(e)}), 422
     except (ImportError, RuntimeError) as e:
         return jsonify({"error": str(e)}), 500
     except Exception as e:
         return jsonify({"error": f"Unexpected error: {str(e)}"}), 500
 
 
+# -----------------------------------------------------------------------------
+# 7b. BATCH RESUME SCREENING API
+# -----------------------------------------------------------------------------
+@app.route('/upload_resumes', methods=['POST'])
+def upload_resumes():
+    """
+    Screens many resumes in one call (e.g. a placement cell's whole batch).
+
+    Input:  multipart/form-data  →  one or more files in field 'files'
+            (PDF, DOCX, TXT, or .zip archives of them)
+            optional field/query 'scoring': overlap (default), jaccard, coverage
+    Output: NDJSON stream, one line per resume as soon as it is done:
+            { filename, extracted_skills, matching_jobs } or { filename, error }
+    """
+    uploads = [(f.filename, f.read()) for f in request.files.getlist('files') if f.filename]
+    if not uploads:
+        return jsonify({"error": "No files uploaded. Send files with field name 'files'."}), 400
+
+    scoring = request.values.get('scoring', 'overlap')
+    if scoring not in SCORING_MODES:
+        return jsonify({"error": f"Unknown scoring mode '{scoring}'. Use one of: {', '.join(SCORING_MODES)}."}), 400
+
+    try:
+        resumes = expand_uploads(uploads)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if not resumes:
+        return jsonify({"error": "No PDF, DOCX or TXT resumes found in the upload."}), 400
+
+    def generate():
+        for result in screen_resumes(resumes, scoring):
+            yield dumps(result) + b"\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+# -----------------------------------------------------------------------------
+# 7c. FULL-TEXT JOB RANKING API
+# -----------------------------------------------------------------------------
+@app.route('/jobs/rank', methods=['POST'])
+def api_jobs_rank():
+    """
+    Ranks jobs by BM25 relevance of their title, skills and description
+    to a block of free text (e.g. a full resume).
+    Expects JSON: {"text": "...", "k": 10}
+    """
+    data = request.get_json(silent=True)
+
+    if not data or not isinstance(data.get('text'), str) or not data['text'].strip():
+        return jsonify({"error": "Please provide a non-empty 'text' in the JSON body"}), 400
+    k = data.get('k', 10)
+    if not isinstance(k, int) or not 1 <= k <= 100:
+        return jsonify({"error": "'k' must be an integer between 1 and 100"}), 400
+
+    return jsonify(rank_jobs(data['text'], k))
+
+
+# -----------------------------------------------------------------------------
+# 8. JOB CACHE STATUS API
+# -----------------------------------------------------------------------------
+@app.route('/jobs/cache', methods=['GET'])
+def api_jobs_cache():
+    """
+    Returns monitoring info for the job cache: size, age, generation,
+    staleness and the duration of the last refresh.
+    """
+    return jsonify(job_cache.stats())
+
+
+# -----------------------------------------------------------------------------
+# 9. BULK JOB EXPORT (NDJSON STREAM)
+# -----------------------------------------------------------------------------
+@app.route('/jobs/export', methods=['GET'])
+def api_jobs_export():
+    """
+    Streams jobs from the job store as NDJSON, one JSON job per line.
+    Memory per request stays constant and the first line is sent right away.
+
+    Query: fields=title,company,...   (optional projection)
+           history=1                  (every stored job, not just the latest snapshot)
+           company=, location= or skill=  (optional exact match, case-insensitive;
+                                       answered from the store's indexes)
+    """
+    fields = [f.strip() for f in request.args.get('fields', '').split(',') if f.strip()]
+    latest_only = request.args.get('history') != '1'
+    filters = [name for name in ('company', 'location', 'skill') if request.args.get(name)]
+    if len(filters) > 1:
+        return jsonify({"error": "Filter the export by at most one of company, location or skill"}), 400
+
+    store = get_store()
+    if filters:
+        lookup = {'company': store.jobs_by_company, 'location': store.jobs_by_location,
+                  'skill': store.jobs_by_skill}[filters[0]]
+        jobs = lookup(request.args[filters[0]], latest_only=latest_only)
+    else:
+        jobs = store.iter_jobs(latest_only=latest_only)
+
+    def generate():
+        for job in jobs:
+            if fields:
+                job = {field: job.get(field) for field in fields}
+            yield dumps(job) + b"\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+# -----------------------------------------------------------------------------
+# 10. METRICS (PROMETHEUS TEXT FORMAT)
+# -----------------------------------------------------------------------------
+@app.route('/metrics', methods=['GET'])
+def api_metrics():
+    """
+    Exposes in-process metrics for Prometheus: per-route latency histograms,
+    per-source fetch durations and outcomes, job cache hits / misses /
+    refreshes, resume parse time per format and the current corpus size.
+    """
+    return Response(render(), content_type=CONTENT_TYPE)
+
+
 # -----------------------------------------------------------------------------
 # Application Execution
 # -----------------------------------------------------------------------------
@@ -0,0 +1,90 @@
+"""
+bench/corpus.py
+---------------
+Deterministic synthetic job corpora for benchmarks and load tests.
+
+Jobs have the same shape as the merged scraper output (title, company,
+location, skills, salary, email, link, description), drawn from the skill
+taxonomy so the indexes, counters and matchers see realistic postings.
+
+    python bench/corpus.py 100k jobs.ndjson     # dump a corpus as NDJSON
+"""
+
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skills import SKILL_TAXONOMY  # noqa: E402
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+ROLES = [
+    "Software Engineer", "Backend Developer", "Frontend Developer", "Full Stack Developer",
+    "Data Scientist", "Data Analyst", "Machine Learning Engineer", "DevOps Engineer",
+    "Cloud Engineer", "Android Developer", "iOS Developer", "QA Engineer",
+    "Product Analyst", "Site Reliability Engineer", "Data Engineer", "UI/UX Designer",
+]
+LEVELS = ["", "Junior ", "Senior ", "Lead ", "Associate ", "Principal "]
+COMPANY_PARTS = ["Infy", "Tata", "Wipro", "Zen", "Nova", "Quantum", "Bharat", "Apex", "Cloud",
+                 "Data", "Pixel", "Vertex", "Sahyadri", "Ganga", "Lotus", "Indus", "Orbit", "Prism"]
+COMPANY_SUFFIXES = ["Technologies", "Labs", "Systems", "Solutions", "Digital", "Software", "Analytics"]
+CITIES = ["Bengaluru", "Hyderabad", "Pune", "Chennai", "Mumbai", "Gurugram", "Noida", "Kolkata",
+          "Ahmedabad", "Kochi", "Jaipur", "Remote (India Eligible)"]
+SENTENCES = [
+    "You will design, build and ship features used by millions of customers.",
+    "We are looking for someone comfortable owning services end to end.",
+    "Experience with code reviews, testing and production support is expected.",
+    "You will collaborate with product managers, designers and other engineers.",
+    "Strong fundamentals in problem solving and communication are a must.",
+    "The role offers flexible hours, health insurance and learning budgets.",
+]
+
+
+def parse_size(size: str) -> int:
+    """'100k' -> 100000; plain integers are accepted too."""
+    size = size.strip().lower()
+    return SIZES[size] if size in SIZES else int(size)
+
+
+def generate_job(rng: random.Random, job_id: int) -> dict:
+    """One synthetic job."""
+    role = rng.choice(ROLES)
+    title = rng.choice(LEVELS) + role
+    company = f"{rng.choice(COMPANY_PARTS)}{rng.choice(COMPANY_PARTS).lower()} {rng.choice(COMPANY_SUFFIXES)}"
+    skills = rng.sample(SKILL_TAXONOMY, rng.randint(2, 7))
+    low = rng.randrange(3, 30) * 100_000
+    high = low + rng.randrange(2, 20) * 100_000
+    domain = company.split()[0].lower() + ".com"
+    description = (
+        f"{company} is hiring a {title} in {rng.choice(CITIES)}. "
+        f"Must know {', '.join(skills)}. " + " ".join(rng.sample(SENTENCES, 3))
+    )
+    return {
+        "title": title,
+        "company": company,
+        "location": rng.choice(CITIES),
+        "skills": skills,
+        "salary": f"₹{low:,} – ₹{high:,} / year",
+        "email": f"careers@{domain}",
+        "link": f"https://jobs.example.com/{job_id}",
+        "description": description,
+        "responsibilities": [],
+    }
+
+
+def generate_jobs(n: int, seed: int = 0) -> list:
+    """`n` synthetic jobs; the same (n, seed) always yields the same list."""
+    rng = random.Random(seed)
+    return [generate_job(rng, job_id) for job_id in range(n)]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python bench/corpus.py <size: 1k|100k|1m|N> <out.ndjson>")
+        sys.exit(2)
+    with open(sys.argv[2], "w", encoding="utf-8") as out:
+        for job in generate_jobs(parse_size(sys.argv[1])):
+            out.write(json.dumps(job, ensure_ascii=False) + "\n")
@@ -0,0 +1,327 @@
+"""
+bench/loadtest.py
+-----------------
+End-to-end load test of the Flask app against a local fake upstream.
+
+The harness:
+  1. starts bench/upstream.py in-process, replaying the recorded Adzuna and
+     RemoteOK payloads with the configured latency / error / timeout rates,
+  2. starts app.py in a separate process (werkzeug, threaded) with the
+     scraper pointed at that upstream and a throwaway job store,
+  3. drives a weighted mix of /jobs, /jobs?skill=..., /dashboard and
+     /upload_resume at a fixed arrival rate (open loop: requests are
+     scheduled on the clock, so a slow server accumulates queueing delay
+     instead of silently lowering the load),
+  4. reports per-route latency histograms and percentiles, throughput,
+     status codes and the upstream call counts (warm-up and measured phase
+     separately) as JSON.
+
+Latency is measured from each request's scheduled start. Runs fully offline.
+
+Usage (from backend/):
+    python bench/loadtest.py --rps 50 --duration 30
+    python bench/loadtest.py --rps 200 --concurrency 64 --mix jobs=5,dashboard=3,upload_resume=2 \\
+        --latency-ms 300 --error-rate 0.1 --timeout-rate 0.02 --cache-ttl 10 --out load.json
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import upstream  # noqa: E402
+
+RESUMES_DIR = os.path.join(BENCH_DIR, "resumes")
+DEFAULT_MIX = "jobs=4,jobs_search=1,dashboard=3,upload_resume=2"
+REQUEST_TIMEOUT = 30
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+_APP_BOOTSTRAP = """
+import sys
+from werkzeug.serving import make_server
+import app
+make_server("127.0.0.1", int(sys.argv[1]), app.app, threaded=True).serve_forever()
+"""
+
+
+# ──────────────────────────────────────────────
+# App process
+# ──────────────────────────────────────────────
+def _free_port() -> int:
+    import socket
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_app(server: upstream.UpstreamServer, cache_ttl: int, log) -> tuple:
+    """
+    Start app.py against the fake upstream, writing its output to the open
+    file `log`. Returns (process, base URL).
+    """
+    port = _free_port()
+    env = dict(os.environ)
+    env.update(upstream.scraper_env(server))
+    env["JOB_STORE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="careerai-load-"), "jobs.db")
+    env["JOB_CACHE_TTL"] = str(cache_ttl)
+    env.pop("RESUME_CACHE_DIR", None)
+    process = subprocess.Popen([sys.executable, "-c", _APP_BOOTSTRAP, str(port)],
+                               cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+    base_url = f"http://127.0.0.1:{port}"
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App exited with status {process.returncode}; see {log.name}")
+        try:
+            with urllib.request.urlopen(base_url + "/", timeout=2):
+                return process, base_url
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"App did not start within 60s; see {log.name}")
+
+
+# ──────────────────────────────────────────────
+# Requests
+# ──────────────────────────────────────────────
+def _multipart(filename: str, data: bytes) -> tuple:
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        "Content-Type: text/plain\r\n\r\n"
+    ).encode("utf-8") + data + f"\r\n--{boundary}--\r\n".encode("utf-8")
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+class Traffic:
+    """Builds the request for each route of the mix."""
+
+    SEARCH_SKILLS = ["Python", "Java", "React", "SQL", "AWS", "Docker", "Node.js"]
+
+    def __init__(self, base_url: str, unique_resumes: bool, seed: int = 0):
+        self.base_url = base_url
+        self.unique_resumes = unique_resumes
+        self.resumes = []
+        for name in sorted(os.listdir(RESUMES_DIR)):
+            with open(os.path.join(RESUMES_DIR, name), "rb") as f:
+                self.resumes.append((name, f.read()))
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def request(self, route: str) -> urllib.request.Request:
+        with self._lock:
+            roll = self._rng.random()
+        if route == "jobs":
+            return urllib.request.Request(self.base_url + "/jobs")
+        if route == "jobs_search":
+            skill = self.SEARCH_SKILLS[int(roll * len(self.SEARCH_SKILLS))]
+            return urllib.request.Request(f"{self.base_url}/jobs?skill={urllib.request.quote(skill)}&limit=20")
+        if route == "dashboard":
+            return urllib.request.Request(self.base_url + "/dashboard")
+        if route == "upload_resume":
+            name, data = self.resumes[int(roll * len(self.resumes))]
+            if self.unique_resumes:
+                # A fresh upload each time, so the resume caches do not absorb the load
+                data += f"\nRef: {uuid.uuid4().hex}\n".encode("ascii")
+            body, content_type = _multipart(name, data)
+            return urllib.request.Request(self.base_url + "/upload_resume", data=body,
+                                          headers={"Content-Type": content_type})
+        raise ValueError(f"Unknown route '{route}'")
+
+
+def send(request: urllib.request.Request) -> int:
+    """Send a request and return its HTTP status (0 on a connection failure)."""
+    try:
+        with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        return e.code
+    except OSError:
+        return 0
+
+
+# ──────────────────────────────────────────────
+# Load generation
+# ──────────────────────────────────────────────
+def parse_mix(mix: str) -> list:
+    """'jobs=4,dashboard=3' -> [("jobs", 4.0), ("dashboard", 3.0)]."""
+    weights = []
+    for part in mix.split(","):
+        route, _, weight = part.partition("=")
+        weights.append((route.strip(), float(weight or 1)))
+    return weights
+
+
+def run_load(traffic: Traffic, mix: list, rps: float, duration: float, concurrency: int,
+             seed: int = 0) -> tuple:
+    """
+    Issue requests at `rps` for `duration` seconds.
+
+    Returns:
+        (samples, elapsed) where samples is a list of (route, status, latency ms).
+    """
+    rng = random.Random(seed)
+    routes = [route for route, _ in mix]
+    weights = [weight for _, weight in mix]
+    total = int(rps * duration)
+    samples = []
+    samples_lock = threading.Lock()
+
+    def fire(route: str, scheduled: float) -> None:
+        status = send(traffic.request(route))
+        latency = (time.perf_counter() - scheduled) * 1000
+        with samples_lock:
+            samples.append((route, status, latency))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load") as pool:
+        for i in range(total):
+            scheduled = started + i / rps
+            pause = scheduled - time.perf_counter()
+            if pause > 0:
+                time.sleep(pause)
+            pool.submit(fire, rng.choices(routes, weights)[0], scheduled)
+    return samples, time.perf_counter() - started
+
+
+# ──────────────────────────────────────────────
+# Reporting
+# ──────────────────────────────────────────────
+def _percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def summarize(latencies: list, statuses: list) -> dict:
+    """Percentiles, histogram and status counts of one group of requests."""
+    latencies = sorted(latencies)
+    histogram = {f"le_{bound}ms": 0 for bound in HISTOGRAM_BUCKETS_MS}
+    histogram["gt_10000ms"] = 0
+    for latency in latencies:
+        for bound in HISTOGRAM_BUCKETS_MS:
+            if latency <= bound:
+                histogram[f"le_{bound}ms"] += 1
+                break
+        else:
+            histogram["gt_10000ms"] += 1
+    status_counts = {}
+    for status in statuses:
+        status_counts[str(status)] = status_counts.get(str(status), 0) + 1
+    return {
+        "requests": len(latencies),
+        "errors": sum(1 for status in statuses if status == 0 or status >= 500),
+        "status": dict(sorted(status_counts.items())),
+        "p50_ms": round(_percentile(latencies, 0.50), 2),
+        "p90_ms": round(_percentile(latencies, 0.90), 2),
+        "p99_ms": round(_percentile(latencies, 0.99), 2),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        "histogram": histogram,
+    }
+
+
+def build_report(samples: list, elapsed: float, config: dict, upstream_counts: dict,
+                 warmup_counts: dict = None) -> dict:
+    """
+    The JSON report. `upstream_counts` covers the measured phase only; with a
+    cache TTL longer than the run it is empty, since the app never refetches
+    after the warm-up (whose calls are in `warmup_counts`).
+    """
+    by_route = {}
+    for route, status, latency in samples:
+        latencies, statuses = by_route.setdefault(route, ([], []))
+        latencies.append(latency)
+        statuses.append(status)
+    return {
+        "config": config,
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "overall": summarize([s[2] for s in samples], [s[1] for s in samples]),
+        "routes": {route: summarize(*values) for route, values in sorted(by_route.items())},
+        "upstream": upstream_counts,
+        "upstream_warmup": warmup_counts or {},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="CareerAI end-to-end load test (offline)")
+    parser.add_argument("--rps", type=float, default=50, help="target arrival rate")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of load")
+    parser.add_argument("--concurrency", type=int, default=32, help="max requests in flight")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="route weights, e.g. jobs=4,dashboard=3,upload_resume=2")
+    parser.add_argument("--cache-ttl", type=int, default=30 * 60,
+                        help="app job cache TTL in seconds (lower it to exercise refreshes under load)")
+    parser.add_argument("--same-resume", action="store_true",
+                        help="upload identical resume bytes (exercises the resume caches)")
+    parser.add_argument("--out", help="write the JSON report here (default: stdout)")
+    upstream.add_arguments(parser)
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    server = upstream.from_arguments(args).start()
+    log_path = os.path.join(tempfile.gettempdir(), "careerai-loadtest-app.log")
+    process = None
+    log = open(log_path, "w")
+    try:
+        process, base_url = start_app(server, args.cache_ttl, log)
+        traffic = Traffic(base_url, unique_resumes=not args.same_resume, seed=args.seed)
+
+        # Let the first (cold) fetch finish before measuring
+        print("[Load] Warming up the job cache...", file=sys.stderr)
+        send(traffic.request("jobs"))
+        warmup_counts = server.counts()
+        server.reset_counts()
+
+        print(f"[Load] {args.rps:g} rps for {args.duration:g}s, mix {args.mix}", file=sys.stderr)
+        samples, elapsed = run_load(traffic, mix, args.rps, args.duration, args.concurrency, args.seed)
+        # Upstream calls made during the measured phase only (reset after warm-up)
+        upstream_counts = server.counts()
+        config = {key: value for key, value in sorted(vars(args).items()) if key != "out"}
+        report = build_report(samples, elapsed, config, upstream_counts, warmup_counts)
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        log.close()
+        server.stop()
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    for route, stats in report["routes"].items():
+        print(f"[Load] {route:14s} n={stats['requests']:6d} p50={stats['p50_ms']:8.1f}ms "
+              f"p99={stats['p99_ms']:8.1f}ms errors={stats['errors']}", file=sys.stderr)
+    print(f"[Load] throughput {report['throughput_rps']} rps; upstream calls {report['upstream']['calls']}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
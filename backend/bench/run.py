@@ -0,0 +1,242 @@
+"""
+bench/run.py
+------------
+Microbenchmarks for the backend hot paths.
+
+  - get_jobs: a cold refresh against the recorded Adzuna / RemoteOK
+    payloads served locally (bench/upstream.py), and the cached path.
+  - Text paths: jobscraper._extract_skills_from_text, resume_upload.extract_skills
+    (on bench/resumes), verify and career_paths.
+  - Corpus paths, per synthetic corpus size (bench/corpus.py): building the
+    job cache snapshot (index + aggregates), match_jobs per scoring mode,
+    match_resume and get_dashboard.
+
+Results are written as JSON with sorted keys; timings are milliseconds per
+call. --compare exits with status 1 when a benchmark's median is slower
+than the baseline by more than --tolerance, so CI can catch regressions.
+
+Usage (from backend/):
+    python bench/run.py                                  # 1k and 100k corpora
+    python bench/run.py --sizes 1k,100k,1m --out bench.json
+    python bench/run.py --out new.json --compare baseline.json --tolerance 0.25
+
+Runs fully offline.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+# Keep the benchmark away from the real job store and from background refreshes
+_tmp = tempfile.mkdtemp(prefix="careerai-bench-")
+os.environ["JOB_STORE_PATH"] = os.path.join(_tmp, "jobs.db")
+os.environ["JOB_CACHE_TTL"] = str(10 ** 9)
+os.environ.pop("RESUME_CACHE_DIR", None)
+
+import jobscraper  # noqa: E402
+from career import career_paths  # noqa: E402
+from corpus import generate_jobs, parse_size  # noqa: E402
+from dashboard import get_dashboard  # noqa: E402
+from jobindex import SCORING_MODES  # noqa: E402
+from resume_match import match_resume  # noqa: E402
+from resume_upload import extract_skills, match_jobs  # noqa: E402
+from upstream import UpstreamServer, point_scraper_at  # noqa: E402
+from verifyjob import verify  # noqa: E402
+
+RESUMES_DIR = os.path.join(BENCH_DIR, "resumes")
+DEFAULT_SIZES = "1k,100k"
+
+
+# ──────────────────────────────────────────────
+# Timing
+# ──────────────────────────────────────────────
+@contextlib.contextmanager
+def quiet():
+    """Silence the modules' [Tag] progress prints (stdout carries the JSON report)."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def measure(fn, repeat: int = 20, number: int = 1, warmup: int = 1) -> dict:
+    """
+    Time `fn` over `repeat` runs of `number` calls each.
+
+    Returns:
+        {"min_ms", "median_ms", "p95_ms", "mean_ms", "runs"}, per call.
+    """
+    with quiet():
+        for _ in range(warmup):
+            fn()
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(number):
+                fn()
+            samples.append((time.perf_counter() - started) * 1000 / number)
+    samples.sort()
+    return {
+        "min_ms":    round(samples[0], 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms":    round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+        "mean_ms":   round(statistics.fmean(samples), 4),
+        "runs":      repeat * number,
+    }
+
+
+def _load_resumes() -> dict:
+    resumes = {}
+    for name in sorted(os.listdir(RESUMES_DIR)):
+        with open(os.path.join(RESUMES_DIR, name), encoding="utf-8") as f:
+            resumes[name.rsplit(".", 1)[0]] = f.read()
+    return resumes
+
+
+# ──────────────────────────────────────────────
+# Benchmarks
+# ──────────────────────────────────────────────
+def bench_scraper(results: dict, meta: dict) -> None:
+    server = UpstreamServer().start()
+    point_scraper_at(server)
+    try:
+        def cold_refresh():
+            jobscraper._live_results.clear()
+            jobscraper._refresh_jobs()
+
+        with quiet():
+            cold_refresh()
+            meta["fixture_jobs"] = len(jobscraper.get_jobs())
+        meta["upstream_calls_per_refresh"] = server.counts()["calls"]
+        results["get_jobs.cold_refresh"] = measure(cold_refresh, repeat=5)
+        results["get_jobs.cached"] = measure(jobscraper.get_jobs, repeat=20, number=1000)
+    finally:
+        server.stop()
+
+
+def bench_text(results: dict, resumes: dict) -> None:
+    with quiet():
+        jobs = jobscraper.get_jobs()
+    texts = [f"{job['title']} {job.get('description', '')}" for job in jobs]
+    results["extract_skills_from_text"] = measure(
+        lambda: [jobscraper._extract_skills_from_text(text) for text in texts], repeat=20)
+    results["extract_skills_from_text"]["calls_per_run"] = len(texts)
+
+    for name, text in resumes.items():
+        results[f"resume_upload.extract_skills.{name}"] = measure(lambda: extract_skills(text), number=50)
+
+    emails = [f"hr{i}@{domain}" for i, domain in enumerate(
+        ["gmail.com", "infosys.com", "mail.yahoo.co.in", "mailinator.com", "careers.tcs.com"] * 200)]
+    results["verify"] = measure(lambda: [verify(email) for email in emails], repeat=20)
+    results["verify"]["calls_per_run"] = len(emails)
+
+    skills = ["Java", "Python", "React", "SQL", "AWS", "Figma", "Unknown"]
+    results["career_paths"] = measure(lambda: [career_paths(skill) for skill in skills], number=50)
+    results["career_paths"]["calls_per_run"] = len(skills)
+
+
+def bench_corpus(results: dict, size: str, resumes: dict) -> None:
+    n = parse_size(size)
+    repeat = 20 if n <= 100_000 else 5
+    jobs = generate_jobs(n)
+    prefix = f"corpus.{size}."
+
+    # Snapshot swap: listeners rebuild the job index and dashboard aggregates
+    started = time.perf_counter()
+    with quiet():
+        jobscraper.job_cache.set(jobs)
+        jobscraper.get_jobs()
+    results[prefix + "snapshot_build"] = {"ms": round((time.perf_counter() - started) * 1000, 1), "jobs": n}
+
+    skill_lists = {name: extract_skills(text) for name, text in resumes.items()}
+    for scoring in sorted(SCORING_MODES):
+        results[prefix + f"match_jobs.{scoring}"] = measure(
+            lambda: [match_jobs(skills, scoring) for skills in skill_lists.values()], repeat=repeat)
+    results[prefix + "match_resume"] = measure(
+        lambda: [match_resume(skills) for skills in skill_lists.values()], repeat=repeat)
+    results[prefix + "get_dashboard"] = measure(get_dashboard, repeat=repeat, number=100)
+
+
+# ──────────────────────────────────────────────
+# Reporting
+# ──────────────────────────────────────────────
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                              capture_output=True, text=True, timeout=5).stdout.strip()
+    except Exception:
+        return ""
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Benchmarks whose median got slower than baseline * (1 + tolerance)."""
+    regressions = []
+    for name, current in sorted(results.items()):
+        before = baseline.get(name)
+        if not before or "median_ms" not in current or not before.get("median_ms"):
+            continue
+        ratio = current["median_ms"] / before["median_ms"]
+        if ratio > 1 + tolerance:
+            regressions.append({"name": name, "baseline_ms": before["median_ms"],
+                                "current_ms": current["median_ms"], "ratio": round(ratio, 2)})
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="CareerAI backend microbenchmarks")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="corpus sizes, e.g. 1k,100k,1m")
+    parser.add_argument("--out", help="write results JSON here (default: stdout)")
+    parser.add_argument("--compare", help="baseline results JSON to check against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown of a median before it counts as a regression")
+    args = parser.parse_args()
+
+    sizes = [s.strip().lower() for s in args.sizes.split(",") if s.strip()]
+    meta = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "commit": _git_commit(),
+        "sizes": sizes,
+    }
+    results = {}
+    resumes = _load_resumes()
+
+    print("[Bench] get_jobs against local fixtures...", file=sys.stderr)
+    bench_scraper(results, meta)
+    print("[Bench] Text paths...", file=sys.stderr)
+    bench_text(results, resumes)
+    for size in sizes:
+        print(f"[Bench] Corpus {size}...", file=sys.stderr)
+        bench_corpus(results, size, resumes)
+
+    report = {"meta": meta, "results": results}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            report["regressions"] = compare(results, json.load(f)["results"], args.tolerance)
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        print(f"[Bench] Results written to {args.out}", file=sys.stderr)
+    else:
+        print(output)
+
+    for regression in report.get("regressions", []):
+        print(f"[Bench] REGRESSION {regression['name']}: {regression['baseline_ms']}ms -> "
+              f"{regression['current_ms']}ms (x{regression['ratio']})", file=sys.stderr)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
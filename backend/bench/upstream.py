@@ -0,0 +1,203 @@
+"""
+bench/upstream.py
+-----------------
+Local stand-in for the Adzuna and RemoteOK APIs, serving the recorded
+payloads in bench/fixtures so the scraper can be exercised offline.
+
+    GET /adzuna/<page>   -> fixtures/adzuna_page<page>.json (empty results past the last page)
+    GET /remoteok        -> fixtures/remoteok.json
+
+Each response can be delayed (latency + jitter), fail with HTTP 500
+(error rate) or hang past the scraper's request timeouts (timeout rate).
+
+Point an in-process scraper at it with point_scraper_at(server), or a
+separate app process with the environment from scraper_env(server).
+Standalone:
+
+    python bench/upstream.py --port 8081 --latency-ms 80 --error-rate 0.05
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixtures(fixtures_dir: str = FIXTURES_DIR) -> dict:
+    """Path -> response body bytes for every recorded payload."""
+    routes = {}
+    for name in sorted(os.listdir(fixtures_dir)):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(fixtures_dir, name), "rb") as f:
+            body = f.read()
+        stem = name[:-len(".json")]
+        if stem.startswith("adzuna_page"):
+            routes["/adzuna/" + stem[len("adzuna_page"):]] = body
+        else:
+            routes["/" + stem] = body
+    return routes
+
+
+class UpstreamServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server replaying fixtures.
+
+    Args:
+        latency_ms:   Delay added to every response.
+        jitter_ms:    Extra uniform random delay, 0..jitter_ms.
+        error_rate:   Share of requests answered with HTTP 500.
+        timeout_rate: Share of requests that hang for `hang_seconds`
+                      (longer than the scraper's request timeouts).
+        seed:         Seed for the random draws, for repeatable runs.
+
+    `calls`, `errors` and `timeouts` count requests per source.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, fixtures_dir: str = FIXTURES_DIR, latency_ms: float = 0,
+                 jitter_ms: float = 0, error_rate: float = 0, timeout_rate: float = 0,
+                 hang_seconds: float = 15, seed: int = 0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.routes = load_fixtures(fixtures_dir)
+        self.empty_page = json.dumps({"count": 0, "results": []}).encode("utf-8")
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.calls = {}
+        self.errors = {}
+        self.timeouts = {}
+        self._rng = random.Random(seed)
+        self._calls_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def plan(self, source: str) -> tuple:
+        """
+        Count a request and decide its fate.
+
+        Returns:
+            (delay in seconds, outcome) with outcome "ok", "error" or "timeout".
+        """
+        with self._calls_lock:
+            self.calls[source] = self.calls.get(source, 0) + 1
+            roll = self._rng.random()
+            delay = (self.latency_ms + self._rng.uniform(0, self.jitter_ms)) / 1000
+            if roll < self.timeout_rate:
+                self.timeouts[source] = self.timeouts.get(source, 0) + 1
+                return self.hang_seconds, "timeout"
+            if roll < self.timeout_rate + self.error_rate:
+                self.errors[source] = self.errors.get(source, 0) + 1
+                return delay, "error"
+            return delay, "ok"
+
+    def counts(self) -> dict:
+        """{"calls": {...}, "errors": {...}, "timeouts": {...}} per source."""
+        with self._calls_lock:
+            return {"calls": dict(sorted(self.calls.items())),
+                    "errors": dict(sorted(self.errors.items())),
+                    "timeouts": dict(sorted(self.timeouts.items()))}
+
+    def reset_counts(self) -> None:
+        with self._calls_lock:
+            self.calls = {}
+            self.errors = {}
+            self.timeouts = {}
+
+    def start(self) -> "UpstreamServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-upstream", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: UpstreamServer
+
+    def do_GET(self):
+        path = urlparse(self.path).path.rstrip("/")
+        source = path.split("/")[1] if path.count("/") else path
+        delay, outcome = self.server.plan(source)
+        if delay:
+            time.sleep(delay)
+        if outcome == "timeout":
+            return      # the client gave up long ago; just drop the connection
+        if outcome == "error":
+            self.send_error(500, "Injected upstream failure")
+            return
+
+        body = self.server.routes.get(path)
+        if body is None and path.startswith("/adzuna/"):
+            body = self.server.empty_page
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def scraper_env(server: UpstreamServer) -> dict:
+    """Environment variables that aim jobscraper's sources at the server."""
+    return {
+        "ADZUNA_URL": server.base_url + "/adzuna/{page}",
+        "REMOTEOK_URL": server.base_url + "/remoteok",
+    }
+
+
+def point_scraper_at(server: UpstreamServer) -> None:
+    """Aim an already imported jobscraper's source URLs at the server."""
+    import jobscraper
+    env = scraper_env(server)
+    jobscraper.ADZUNA_URL = env["ADZUNA_URL"]
+    jobscraper.REMOTEOK_URL = env["REMOTEOK_URL"]
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Command-line knobs for the stand-in, shared with bench/loadtest.py."""
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay added to every upstream response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="extra random upstream delay, 0..N ms")
+    parser.add_argument("--error-rate", type=float, default=0, help="share of upstream requests answered with 500")
+    parser.add_argument("--timeout-rate", type=float, default=0, help="share of upstream requests that hang")
+    parser.add_argument("--hang-seconds", type=float, default=15, help="how long a hanging request hangs")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def from_arguments(args, port: int = 0) -> UpstreamServer:
+    return UpstreamServer(port=port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                          error_rate=args.error_rate, timeout_rate=args.timeout_rate,
+                          hang_seconds=args.hang_seconds, seed=args.seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Adzuna / RemoteOK upstream")
+    parser.add_argument("--port", type=int, default=8081)
+    add_arguments(parser)
+    args = parser.parse_args()
+    server = from_arguments(args, args.port)
+    for name, value in scraper_env(server).items():
+        print(f"export {name}='{value}'")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(json.dumps(server.counts()))
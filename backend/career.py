@@ -1,90 +1,90 @@
+import heapq
+import json
+import os
+
+from skills import skill_registry
+
+CAREERS_PATH = os.environ.get(
+    "CAREERS_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "careers.json")
+)
+
+
+class CareerCatalog:
+    """
+    Career options and their required skills, loaded once from a JSON data
+    file, with a skill id -> career index so lookups cost one dict access
+    per input skill however many careers the catalog holds.
+    """
+
+    def __init__(self, careers: list):
+        self.careers = careers
+        self.required_ids = [skill_registry.intern_all(c["required_skills"]) for c in careers]
+        self.by_skill = {}
+        for career_id, skill_ids in enumerate(self.required_ids):
+            for skill_id in skill_ids:
+                self.by_skill.setdefault(skill_id, []).append(career_id)
+
+    @classmethod
+    def load(cls, path: str = CAREERS_PATH) -> "CareerCatalog":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def rank(self, skill_ids, limit: int = 10) -> list:
+        """
+        Careers sharing at least one skill with `skill_ids`, best coverage first.
+
+        Returns:
+            List of (career_id, matched skill ids, missing skill ids).
+        """
+        have = set(skill_ids)
+        hits = {}
+        for skill_id in have:
+            for career_id in self.by_skill.get(skill_id, ()):
+                hits[career_id] = hits.get(career_id, 0) + 1
+
+        def coverage(career_id):
+            return hits[career_id] / len(self.required_ids[career_id])
+
+        best = heapq.nlargest(limit, hits, key=lambda cid: (coverage(cid), hits[cid], -cid))
+        results = []
+        for career_id in best:
+            required = self.required_ids[career_id]
+            results.append((
+                career_id,
+                [s for s in required if s in have],
+                [s for s in required if s not in have],
+            ))
+        return results
+
+
+catalog = CareerCatalog.load()
+
+
 def career_paths(skill):
     """
     Suggests multiple career options paths for a given skill.
     Returns a JSON-serializable dictionary with matching careers and their required skills.
     """
     skill = skill.lower().strip()
-
-    # Define the career options and their required skills
-    careers_db = [
-        {
-            "career": "Software Engineer",
-            "required_skills": ["Java", "C++", "Python", "DSA", "OOP", "Git", "System Design"]
-        },
-        {
-            "career": "Backend Developer",
-            "required_skills": ["Java", "Python", "NodeJS", "SpringBoot", "Django", "REST API", "MySQL", "MongoDB"]
-        },
-        {
-            "career": "Frontend Developer",
-            "required_skills": ["HTML", "CSS", "JavaScript", "React", "Vue", "Angular", "UI Design"]
-        },
-        {
-            "career": "Full Stack Developer",
-            "required_skills": ["JavaScript", "React", "NodeJS", "SQL", "APIs", "MongoDB"]
-        },
-        {
-            "career": "Data Analyst",
-            "required_skills": ["SQL", "Excel", "Power BI", "Python", "Tableau"]
-        },
-        {
-            "career": "Data Scientist",
-            "required_skills": ["Python", "R", "Machine Learning", "Statistics", "Pandas", "Numpy"]
-        },
-        {
-            "career": "Machine Learning Engineer",
-            "required_skills": ["Python", "Deep Learning", "TensorFlow", "Scikit-learn", "PyTorch"]
-        },
-        {
-            "career": "AI Engineer",
-            "required_skills": ["Python", "Deep Learning", "NLP", "LLMs", "TensorFlow"]
-        },
-        {
-            "career": "Mobile Developer",
-            "required_skills": ["Java", "Kotlin", "Swift", "Android", "Flutter", "React Native", "Android Studio"]
-        },
-        {
-            "career": "DevOps Engineer",
-            "required_skills": ["Docker", "Kubernetes", "AWS", "CI/CD", "Linux", "Jenkins"]
-        },
-        {
-            "career": "Cyber Security Engineer",
-            "required_skills": ["Networking", "Ethical Hacking", "Linux", "Security Tools", "Python"]
-        },
-        {
-            "career": "Cloud Engineer",
-            "required_skills": ["AWS", "Azure", "Cloud Computing", "Linux", "GCP"]
-        },
-        {
-            "career": "Game Developer",
-            "required_skills": ["Unity", "C#", "C++", "Game Physics", "Unreal Engine"]
-        },
-        {
-            "career": "Web Developer",
-            "required_skills": ["HTML", "CSS", "JavaScript", "Hosting", "PHP"]
-        }
-    ]
+    # Aliases resolve to the same id ("nodejs" -> Node.js)
+    skill_id = skill_registry.lookup(skill)
 
     matched_careers = []
     
-    # Iterate over our defined database and see if the user's skill matches any required skills
-    for career in careers_db:
-        # Convert required skills to lowercase for resilient matching
-        required_skills_lower = [s.lower() for s in career["required_skills"]]
+    # Look up the careers requiring the user's skill in the precomputed index
+    for career_id in catalog.by_skill.get(skill_id, []):
+        career = catalog.careers[career_id]
+        # Reconstruct the career object removing the user's skill from required (or showing all)
+        # The prompt says: Return career & required_skills.
+        # However, since the frontend expects `learn` and `role` to display it correctly,
+        # we'll map the standard frontend fields to not break the UI flow chart.
+        matched_careers.append({
+            "career": career["career"],
+            "role": career["career"], # Added for frontend UI combability
+            "required_skills": career["required_skills"],
+            "learn": ', '.join([s for s in career["required_skills"] if skill_registry.lookup(s) != skill_id][:2]) # Added for frontend UI compatibility
+        })
         
-        # Check against the input skill
-        if skill in required_skills_lower:
-            # Reconstruct the career object removing the user's skill from required (or showing all)
-            # The prompt says: Return career & required_skills.
-            # However, since the frontend expects `learn` and `role` to display it correctly,
-            # we'll map the standard frontend fields to not break the UI flow chart.
-            matched_careers.append({
-                "career": career["career"],
-                "role": career["career"], # Added for frontend UI combability
-                "required_skills": career["required_skills"],
-                "learn": ', '.join([s for s in career["required_skills"] if s.lower() != skill][:2]) # Added for frontend UI compatibility
-            })
-            
     # If no exact matches are found, return a default suggestion
     if not matched_careers:
         return {
@@ -103,3 +103,39 @@ def career_paths(skill):
         "skill": skill.capitalize(),
         "career_paths": matched_careers
     }
+
+
+def career_paths_batch(skills):
+    """
+    Answers career_paths() for many skills in one call, all served from the
+    same precomputed skill -> career index.
+    Returns one result per input skill, in input order.
+    """
+    return [career_paths(skill) for skill in skills]
+
+
+def rank_careers(skills, limit=10):
+    """
+    Ranks careers by how much of their required skill set the user already has.
+    Returns a JSON-serializable dictionary with, for each career, the coverage
+    ratio plus the matched and missing skills (the gap to close).
+    """
+    skill_ids = skill_registry.lookup_all(skills)
+
+    career_matches = []
+    for career_id, matched, missing in catalog.rank(skill_ids, limit):
+        career = catalog.careers[career_id]
+        career_matches.append({
+            "career": career["career"],
+            "role": career["career"],
+            "required_skills": career["required_skills"],
+            "coverage": round(len(matched) / len(matched + missing), 3),
+            "matched_skills": [skill_registry.name(s) for s in matched],
+            "missing_skills": [skill_registry.name(s) for s in missing],
+            "learn": ', '.join(skill_registry.name(s) for s in missing[:2])
+        })
+
+    return {
+        "skills": [skill_registry.name(s) for s in skill_ids],
+        "career_paths": career_matches
+    }
@@ -0,0 +1,162 @@
+"""
+dedupe.py
+---------
+Near-duplicate detection for the merged job feed.
+
+Exact deduplication (utils.job_key) misses the same posting syndicated
+with small wording changes ("Sr. Java Dev" vs "Senior Java Developer").
+Each job is reduced to a set of shingles (normalized title and company
+words plus description word pairs) and sketched with one-permutation
+MinHash: every shingle is hashed once and the minimum is kept per bin, so
+a signature costs O(shingles) rather than O(shingles x permutations).
+
+Signatures are split into LSH bands, and bucket keys include the
+normalized company, so only postings of the same employer that share a
+band are compared; this keeps deduplication roughly linear in the number
+of jobs and never merges the same role at two different companies. A
+candidate is a duplicate when the estimated Jaccard similarity of the
+whole job and the overlap of the title words both clear their thresholds,
+and the titles name the same seniority ("Senior" and "Sr." match, "Senior"
+and no level do not).
+"""
+
+import re
+import zlib
+
+# 16 bands of 3 bins: pairs at Jaccard 0.6 become candidates ~98% of the
+# time, pairs at 0.1 under 2%.
+NUM_BINS = 48                 # signature length
+BANDS = 16                    # LSH bands of NUM_BINS // BANDS bins each
+SIMILARITY_THRESHOLD = 0.6    # estimated Jaccard of the whole job
+TITLE_THRESHOLD = 0.6         # Jaccard of the normalized title words
+
+_ROWS = NUM_BINS // BANDS
+_VALUE_BITS = 56
+_VALUE_MASK = (1 << _VALUE_BITS) - 1
+_EMPTY = 1 << 64
+_MASK64 = (1 << 64) - 1
+_MIX = 0x9E3779B97F4A7C15      # odd 64-bit constant spreading crc32 over 64 bits
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+# Abbreviations expanded before shingling
+ABBREVIATIONS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "jnr": "junior",
+    "dev": "developer", "devs": "developer", "developers": "developer",
+    "eng": "engineer", "engr": "engineer", "engineers": "engineer",
+    "mgr": "manager", "mgmt": "management", "assoc": "associate",
+    "admin": "administrator", "exec": "executive", "fe": "frontend",
+    "be": "backend", "fullstack": "full stack", "ml": "machine learning",
+    "swe": "software engineer", "sde": "software engineer", "qa": "quality assurance",
+}
+
+# Seniority words: titles differing in these are different roles
+LEVEL_WORDS = frozenset({"senior", "junior", "lead", "principal", "staff", "associate",
+                         "intern", "trainee", "head", "chief"})
+
+# Company suffixes that vary between boards
+COMPANY_SUFFIXES = {"ltd", "limited", "pvt", "private", "inc", "llc", "llp", "corp", "co", "technologies"}
+
+
+_EXPANSIONS = {short: tuple(full.split()) for short, full in ABBREVIATIONS.items()}
+
+
+def _words(text: str) -> list:
+    return [w for word in _WORD_RE.findall(text.lower()) for w in _EXPANSIONS.get(word, (word,))]
+
+
+def title_words(job: dict) -> frozenset:
+    """Normalized title words ("Sr. Java Dev" -> {senior, java, developer})."""
+    return frozenset(_words(job.get("title", "")))
+
+
+def company_key(job: dict) -> str:
+    """Normalized company name ("Infosys Ltd" and "INFOSYS" -> "infosys")."""
+    return " ".join(word for word in _words(job.get("company", "")) if word not in COMPANY_SUFFIXES)
+
+
+def shingles(job: dict, title: frozenset = None) -> set:
+    """Title words, company words and description word pairs of a job."""
+    result = {"t:" + word for word in (title_words(job) if title is None else title)}
+    result.update("c:" + word for word in _words(job.get("company", "")) if word not in COMPANY_SUFFIXES)
+    desc = _words(job.get("description", ""))
+    result.update(f"d:{a} {b}" for a, b in zip(desc, desc[1:]))
+    return result
+
+
+def signature(items: set) -> tuple:
+    """
+    One-permutation MinHash signature of a shingle set: the top bits of
+    each hash pick a bin, the low bits compete for that bin's minimum. Empty
+    bins borrow the next non-empty bin's value (rotation densification).
+    """
+    bins = [_EMPTY] * NUM_BINS
+    for item in items:
+        h = (zlib.crc32(item.encode("utf-8")) * _MIX) & _MASK64
+        b = (h >> _VALUE_BITS) * NUM_BINS >> 8
+        value = h & _VALUE_MASK
+        if value < bins[b]:
+            bins[b] = value
+    if _EMPTY in bins and any(v != _EMPTY for v in bins):
+        filled = list(bins)
+        for i in range(NUM_BINS):
+            if filled[i] == _EMPTY:
+                step = 1
+                while bins[(i + step) % NUM_BINS] == _EMPTY:
+                    step += 1
+                filled[i] = bins[(i + step) % NUM_BINS] + step * _EMPTY
+        bins = filled
+    return tuple(bins)
+
+
+def similarity(sig_a: tuple, sig_b: tuple) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(a == b for a, b in zip(sig_a, sig_b)) / NUM_BINS
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def drop_near_duplicates(jobs: list) -> list:
+    """
+    Keep the first of every group of near-duplicate jobs, in order.
+    Earlier jobs win, so live sources keep priority over the fallback DB.
+    """
+    buckets = {}     # (company, band, band values) -> indexes into `kept`
+    kept = []        # (signature, title words) of kept jobs
+    unique = []
+    for job in jobs:
+        title = title_words(job)
+        company = company_key(job)
+        sig = signature(shingles(job, title))
+        keys = [(company, band, sig[band * _ROWS:(band + 1) * _ROWS]) for band in range(BANDS)]
+
+        seen = set()
+        duplicate = False
+        for key in keys:
+            for other in buckets.get(key, ()):
+                if other in seen:
+                    continue
+                seen.add(other)
+                other_sig, other_title = kept[other]
+                if (title & LEVEL_WORDS == other_title & LEVEL_WORDS
+                        and similarity(sig, other_sig) >= SIMILARITY_THRESHOLD
+                        and _jaccard(title, other_title) >= TITLE_THRESHOLD):
+                    duplicate = True
+                    break
+            if duplicate:
+                break
+        if duplicate:
+            continue
+
+        for key in keys:
+            buckets.setdefault(key, []).append(len(kept))
+        kept.append((sig, title))
+        unique.append(job)
+
+    if len(unique) < len(jobs):
+        print(f"[Dedupe] Dropped {len(jobs) - len(unique)} near-duplicate jobs.")
+    return unique
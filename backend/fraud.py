@@ -0,0 +1,153 @@
+"""
+fraud.py
+--------
+Ingest-time fraud scoring for job listings.
+
+Every merged job snapshot goes through score_jobs() once, when it is
+built (see jobscraper._merge_jobs), and each job carries the result:
+
+    "fraud_score":   0.0 (clean) .. 1.0 (almost certainly a scam)
+    "fraud_signals": ["free_email_domain", "salary_outlier", ...]
+
+The score combines independent signals as 1 - Π(1 - weight):
+  - the contact email's domain (via verifyjob's domain lists), for jobs
+    that list one,
+  - a salary that is an outlier for its currency in the current snapshot,
+  - scam phrasing in the title or full description ("registration fee", ...).
+
+Requests never rescore; /jobs filters on the stored score through the job
+index (see JobIndex.filter_ids(max_risk=...)).
+"""
+
+import math
+import re
+import statistics
+
+from utils import full_description, parse_salary_max
+from verifyjob import verifier
+
+# Weight of each signal in the combined score
+SIGNAL_WEIGHTS = {
+    "disposable_email_domain": 0.6,
+    "free_email_domain":       0.35,
+    "invalid_email":           0.35,
+    "salary_outlier":          0.35,
+    "suspicious_phrase":       0.25,   # per distinct phrase, up to MAX_PHRASE_HITS
+}
+MAX_PHRASE_HITS = 3
+
+# Salary outliers: modified z-score of log(salary) within one currency
+SALARY_OUTLIER_Z = 3.5
+SALARY_MIN_SAMPLES = 10
+
+SUSPICIOUS_PHRASES = [
+    "registration fee", "registration charges", "processing fee", "security deposit",
+    "training fee", "refundable deposit", "pay to apply", "payment required",
+    "no interview", "no experience required", "guaranteed income", "guaranteed job",
+    "earn per day", "daily payout", "work from home and earn", "easy money",
+    "limited slots", "whatsapp", "telegram", "wire transfer", "gift card",
+    "send your bank details", "aadhaar and bank details", "100% job guarantee",
+]
+
+_PHRASE_RE = re.compile(
+    r"(?<!\w)(?:" + "|".join(re.escape(p) for p in sorted(SUSPICIOUS_PHRASES, key=len, reverse=True)) + r")(?!\w)",
+    re.IGNORECASE,
+)
+
+_EMAIL_SIGNALS = {
+    "disposable_domain": "disposable_email_domain",
+    "free_email_domain": "free_email_domain",
+    "invalid_email":     "invalid_email",
+}
+
+
+def _currency(salary: str) -> str:
+    """Currency bucket of a salary string: its first currency symbol, if any."""
+    for char in salary:
+        if char in "₹$€£":
+            return char
+    return ""
+
+
+def _is_own_domain(domain: str, company: str) -> bool:
+    """True if the domain's registrable name ("zoho" in "mail.zoho.com") is the company's."""
+    labels = domain.split(".")
+    name = labels[-2] if len(labels) >= 2 else domain
+    return name in re.findall(r"\w+", company.lower())
+
+
+def salary_bands(jobs: list) -> dict:
+    """
+    Per-currency (median, MAD) of log(upper salary bound) over a snapshot.
+    Currencies with fewer than SALARY_MIN_SAMPLES salaries are left out.
+    """
+    samples = {}
+    for job in jobs:
+        salary = job.get("salary")
+        value = parse_salary_max(salary)
+        if value and value > 0:
+            samples.setdefault(_currency(salary), []).append(math.log(value))
+
+    bands = {}
+    for currency, values in samples.items():
+        if len(values) < SALARY_MIN_SAMPLES:
+            continue
+        median = statistics.median(values)
+        mad = statistics.median(abs(v - median) for v in values)
+        if mad > 0:
+            bands[currency] = (median, mad)
+    return bands
+
+
+def job_signals(job: dict, bands: dict) -> list:
+    """Fraud signals raised by one job, given the snapshot's salary bands."""
+    signals = []
+
+    email = job.get("email")
+    if email:
+        result = verifier.check(email)
+        reason = result["reason"]
+        # A mail provider hiring from its own domain (careers@zoho.com at Zoho)
+        if reason == "free_email_domain" and _is_own_domain(result["domain"], job.get("company", "")):
+            reason = None
+        if reason in _EMAIL_SIGNALS:
+            signals.append(_EMAIL_SIGNALS[reason])
+
+    salary = job.get("salary")
+    value = parse_salary_max(salary)
+    if value and value > 0:
+        band = bands.get(_currency(salary))
+        if band is not None:
+            median, mad = band
+            if abs(0.6745 * (math.log(value) - median) / mad) > SALARY_OUTLIER_Z:
+                signals.append("salary_outlier")
+
+    text = f"{job.get('title', '')} {full_description(job)}"
+    phrases = dict.fromkeys(match.group(0).lower() for match in _PHRASE_RE.finditer(text))
+    signals.extend(f"suspicious_phrase:{phrase}" for phrase in list(phrases)[:MAX_PHRASE_HITS])
+    return signals
+
+
+def risk_score(signals: list) -> float:
+    """Combine signals into a 0..1 score."""
+    clean = 1.0
+    for signal in signals:
+        clean *= 1 - SIGNAL_WEIGHTS[signal.split(":", 1)[0]]
+    return round(1 - clean, 3)
+
+
+def score_jobs(jobs: list) -> list:
+    """
+    Attach fraud_score and fraud_signals to every job of a snapshot.
+    Jobs whose score is unchanged are returned as the same dict.
+    """
+    bands = salary_bands(jobs)
+    scored = []
+    for job in jobs:
+        signals = job_signals(job, bands)
+        score = risk_score(signals)
+        if job.get("fraud_score") == score and job.get("fraud_signals") == signals:
+            scored.append(job)
+        else:
+            scored.append({**job, "fraud_score": score, "fraud_signals": signals})
+    return scored
@@ -0,0 +1,343 @@
+"""
+jobindex.py
+-----------
+Inverted skill → job index over the cached job list.
+
+The index is rebuilt once per job cache refresh (see JobCache.add_listener)
+and shared by resume matching endpoints, so a request only has to merge the
+posting lists of the user's skills instead of scanning every job.
+
+Ranking scores every job in one batched pass over bitsets (Python ints
+with one bit per job): the query's posting bitsets are summed with a
+bit-sliced adder, giving per-job overlap counts as a handful of bit planes,
+and jobs are then taken group by group -- (overlap, job skill count) pairs
+share one score -- in score order until k are found. Cost is a few dozen
+big-int operations per query instead of a Python loop over candidates.
+
+Company, location and free-text token postings plus a salary-sorted array
+back the filtered, cursor-paginated /jobs API (see search_jobs()).
+"""
+
+import base64
+import bisect
+import re
+import threading
+
+from jobscraper import get_jobs, job_cache
+from skills import skill_registry
+from utils import full_description, parse_salary_max
+
+
+class JobIndex:
+    """
+    Immutable index over one snapshot of the job list.
+
+    Attributes:
+        jobs:       The snapshot the index was built from.
+        generation: Job cache generation of that snapshot.
+        postings:   Skill id -> ascending list of job ids (positions in `jobs`).
+        job_skills: Job id -> that job's skill ids, in listing order.
+        posting_bits: Skill id -> bitset of the jobs listing it (bit n = job id n).
+        size_bits:  Number of skills -> bitset of the jobs listing that many.
+        all_bits:   Bitset of every job.
+        company_postings / location_postings / text_postings:
+                    Lowercased token -> ascending list of job ids.
+        salaries:   Sorted (upper salary bound, job id) pairs.
+        risks:      Sorted (fraud score, job id) pairs (see fraud.py).
+    """
+
+    def __init__(self, jobs: list, generation: int = 0):
+        self.jobs = jobs
+        self.generation = generation
+        self.postings = {}
+        self.job_skills = []
+        self.company_postings = {}
+        self.location_postings = {}
+        self.text_postings = {}
+        self.salaries = []
+        self.risks = []
+
+        for job_id, job in enumerate(jobs):
+            skill_ids = skill_registry.intern_all(job.get("skills", []))
+            self.job_skills.append(skill_ids)
+            for skill_id in skill_ids:
+                self.postings.setdefault(skill_id, []).append(job_id)
+
+            _add_tokens(self.company_postings, job_id, job.get("company", ""))
+            _add_tokens(self.location_postings, job_id, job.get("location", ""))
+            _add_tokens(
+                self.text_postings, job_id,
+                " ".join([job.get("title", ""), job.get("company", ""), job.get("location", ""),
+                          full_description(job)] + job.get("skills", [])),
+            )
+            salary = parse_salary_max(job.get("salary"))
+            if salary is not None:
+                self.salaries.append((salary, job_id))
+            self.risks.append((job.get("fraud_score", 0.0), job_id))
+
+        self.salaries.sort()
+        self.risks.sort()
+
+        self.all_bits = (1 << len(jobs)) - 1
+        self.posting_bits = {skill_id: _bitset(ids, len(jobs)) for skill_id, ids in self.postings.items()}
+        sizes = {}
+        for job_id, skill_ids in enumerate(self.job_skills):
+            if skill_ids:
+                sizes.setdefault(len(skill_ids), []).append(job_id)
+        self.size_bits = {size: _bitset(ids, len(jobs)) for size, ids in sizes.items()}
+
+    def candidates(self, skill_ids) -> dict:
+        """
+        Merge the posting lists of the given skill ids.
+
+        Returns:
+            Job id -> number of the given skills the job lists.
+        """
+        hits = {}
+        for skill_id in skill_ids:
+            for job_id in self.postings.get(skill_id, ()):
+                hits[job_id] = hits.get(job_id, 0) + 1
+        return hits
+
+    def top_k(self, skill_ids, k: int = 10, scoring: str = "overlap") -> list:
+        """
+        Rank the jobs sharing at least one skill with the query.
+
+        Args:
+            skill_ids:    Query skill ids (see skills.skill_registry).
+            k:            Number of results to keep.
+            scoring:      One of SCORING_MODES.
+
+        Returns:
+            List of (job_id, score), best first; ties keep listing order.
+        """
+        score = SCORING_MODES[scoring]
+        query = set(skill_ids)
+        masks = [self.posting_bits[skill_id] for skill_id in query if skill_id in self.posting_bits]
+        if not masks or k <= 0:
+            return []
+        planes = _bit_sliced_sum(masks)
+        inverted = [self.all_bits ^ plane for plane in planes]
+
+        # Jobs with the same overlap and skill count share a score
+        groups = {}
+        for common in range(1, len(masks) + 1):
+            for size in self.size_bits:
+                if size >= common:
+                    groups.setdefault(score(common, size, len(query)), []).append((common, size))
+
+        exact = {}
+        results = []
+        for value in sorted(groups, reverse=True):
+            bits = 0
+            for common, size in groups[value]:
+                if common not in exact:
+                    exact[common] = _count_equals(planes, inverted, self.all_bits, common)
+                bits |= exact[common] & self.size_bits[size]
+            while bits and len(results) < k:
+                lowest = bits & -bits
+                results.append((lowest.bit_length() - 1, value))
+                bits ^= lowest
+            if len(results) >= k:
+                break
+        return results
+
+    def filter_ids(self, skills=(), company=None, location=None, min_salary=None, text=None,
+                   max_risk=None):
+        """
+        Ids of the jobs matching every given filter, in listing order
+        (a list, or a range when no filter is given).
+
+        Args:
+            skills:     Skills the job must all list (case-insensitive).
+            company:    Words that must all appear in the company name.
+            location:   Words that must all appear in the location.
+            min_salary: Jobs whose upper salary bound is at least this.
+            text:       Words that must all appear in title, company,
+                        location, full description or skills.
+            max_risk:   Jobs whose fraud score is at most this.
+        """
+        sets = []
+        for skill in skills:
+            skill_id = skill_registry.lookup(skill)
+            sets.append(self.postings.get(skill_id, ()) if skill_id is not None else ())
+        for postings, value in ((self.company_postings, company),
+                                (self.location_postings, location),
+                                (self.text_postings, text)):
+            if value:
+                sets.extend(postings.get(token, ()) for token in _tokens(value))
+        if min_salary is not None:
+            start = bisect.bisect_left(self.salaries, (min_salary, -1))
+            sets.append([job_id for _, job_id in self.salaries[start:]])
+        if max_risk is not None:
+            end = bisect.bisect_right(self.risks, (max_risk, len(self.jobs)))
+            sets.append([job_id for _, job_id in self.risks[:end]])
+
+        if not sets:
+            return range(len(self.jobs))
+
+        # Intersect starting from the shortest posting list
+        sets.sort(key=len)
+        result = set(sets[0])
+        for ids in sets[1:]:
+            if not result:
+                break
+            result.intersection_update(ids)
+        return sorted(result)
+
+
+def _bitset(job_ids, size: int) -> int:
+    """Bitset (bit n = job id n) of the given job ids."""
+    buffer = bytearray((size + 7) // 8)
+    for job_id in job_ids:
+        buffer[job_id >> 3] |= 1 << (job_id & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _bit_sliced_sum(masks: list) -> list:
+    """
+    Per-bit sum of the given bitsets, as bit planes: bit n of planes[i] is
+    bit i of the number of masks that have bit n set.
+    """
+    planes = []
+    for mask in masks:
+        carry = mask
+        for i, plane in enumerate(planes):
+            planes[i] = plane ^ carry
+            carry &= plane
+            if not carry:
+                break
+        if carry:
+            planes.append(carry)
+    return planes
+
+
+def _count_equals(planes: list, inverted: list, all_bits: int, count: int) -> int:
+    """Bitset of the positions whose bit-sliced sum equals `count`."""
+    if count >> len(planes):
+        return 0
+    bits = all_bits
+    for i, (plane, inverse) in enumerate(zip(planes, inverted)):
+        bits &= plane if count >> i & 1 else inverse
+    return bits
+
+
+def _overlap(common: int, job_size: int, query_size: int):
+    """Number of query skills the job lists."""
+    return common
+
+
+def _jaccard(common: int, job_size: int, query_size: int) -> float:
+    """|job ∩ query| / |job ∪ query|."""
+    return round(common / (job_size + query_size - common), 3)
+
+
+def _coverage(common: int, job_size: int, query_size: int) -> float:
+    """Share of the job's skills the query covers."""
+    return round(common / job_size, 3)
+
+
+SCORING_MODES = {
+    "overlap":  _overlap,
+    "jaccard":  _jaccard,
+    "coverage": _coverage,
+}
+
+
+_TOKEN_RE = re.compile(r"[\w+#]+")
+
+
+def _tokens(text: str) -> set:
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def _add_tokens(postings: dict, job_id: int, text: str) -> None:
+    for token in _tokens(text):
+        postings.setdefault(token, []).append(job_id)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def _build_index(jobs: list) -> JobIndex:
+    global _index
+    with _index_lock:
+        if _index is None or _index.jobs is not jobs:
+            _index = JobIndex(jobs, job_cache.generation)
+        return _index
+
+
+def get_index() -> JobIndex:
+    """
+    Return the index for the current job snapshot, building it if the cache
+    was refreshed before the listener ran (or before this module loaded).
+    """
+    jobs = get_jobs()
+    index = _index
+    if index is not None and index.jobs is jobs:
+        return index
+    return _build_index(jobs)
+
+
+job_cache.add_listener(_build_index)
+
+
+# ──────────────────────────────────────────────
+# Cursor pagination
+# ──────────────────────────────────────────────
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def _encode_cursor(generation: int, after: int) -> str:
+    raw = f"{generation}:{after}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        generation, after = base64.urlsafe_b64decode(padded).decode("ascii").split(":")
+        return int(generation), int(after)
+    except Exception:
+        raise ValueError("Invalid cursor.")
+
+
+def search_jobs(skills=(), company=None, location=None, min_salary=None, text=None,
+                max_risk=None, cursor=None, limit=DEFAULT_PAGE_SIZE) -> dict:
+    """
+    One page of jobs matching the filters, answered from the index.
+
+    The cursor is opaque to clients: it records the snapshot generation and
+    the last job id returned. A cursor from an older snapshot is rejected,
+    since job ids are not stable across refreshes.
+
+    Returns:
+        {"jobs": [...], "total": n, "next_cursor": str or None}
+
+    Raises:
+        ValueError: for a malformed or expired cursor.
+    """
+    index = get_index()
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+    after = -1
+    if cursor:
+        generation, after = _decode_cursor(cursor)
+        if generation != index.generation:
+            raise ValueError("Cursor expired: the job list was refreshed. Restart from the first page.")
+
+    ids = index.filter_ids(skills, company, location, min_salary, text, max_risk)
+    start = bisect.bisect_right(ids, after)
+    page = ids[start:start + limit]
+
+    next_cursor = None
+    if start + limit < len(ids):
+        next_cursor = _encode_cursor(index.generation, page[-1])
+
+    return {
+        "jobs": [index.jobs[job_id] for job_id in page],
+        "total": len(ids),
+        "next_cursor": next_cursor,
+    }
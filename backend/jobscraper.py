@@ -6,86 +6,279 @@ Strategy (in order of priority):
   2. RemoteOK JSON API  – Remote tech jobs (filtered for India-friendly roles)
   3. Indian Fallback DB – 30 hand-crafted Indian company jobs (always reliable)
 
+Live sources (1 and 2) are fetched concurrently under one overall deadline;
+whatever has not arrived by then is merged into the cache when it finishes.
+The merged list lives in a TTL cache: once it expires the stale list keeps
+being served while a single background thread rebuilds it. Each refresh is
+also persisted to the SQLite job store, which warm_start() reloads on boot.
+
 Author: CareerAI Team
 """
 
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
 import requests
-from utils import extract_skills
+from requests.adapters import HTTPAdapter
+from dedupe import drop_near_duplicates
+from fraud import score_jobs
+from jobstore import get_store
+from metrics import JOB_CACHE_REFRESHES, SOURCE_FETCH_DURATION, SOURCE_FETCHES, Gauge
+from skills import extract_skills, skill_registry
+from utils import job_key, set_full_descriptions
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Cache: avoid re-fetching on every API call
 # ─────────────────────────────────────────────────────────────────────────────
-_cached_jobs = []
+
+# Seconds a merged job list stays fresh before a background refresh kicks in
+CACHE_TTL = int(os.environ.get("JOB_CACHE_TTL", 30 * 60))
+
+# Seconds get_jobs() waits for the live sources before serving what it has
+FETCH_DEADLINE = 6
+
+
+class JobCache:
+    """
+    TTL cache holding the merged job list with stale-while-revalidate semantics.
+
+    The list itself is never mutated: set() swaps in a new list object, so
+    callers holding an older snapshot keep a consistent view. Every swap bumps
+    `generation`, which derived structures can use to know when to rebuild.
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL):
+        self.ttl = ttl
+        self.generation = 0
+        self.last_refresh_duration = 0.0
+        self._jobs = []
+        self._refreshed_at = 0.0
+        self._refreshing = False
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    @property
+    def age(self) -> float:
+        """Seconds since the current snapshot was stored (0 when empty)."""
+        if not self._refreshed_at:
+            return 0.0
+        return time.monotonic() - self._refreshed_at
+
+    @property
+    def is_stale(self) -> bool:
+        return bool(self._jobs) and self.age >= self.ttl
+
+    @property
+    def state(self) -> str:
+        """"hit" (fresh), "stale" (served while refreshing) or "miss" (empty)."""
+        if not self._jobs:
+            return "miss"
+        return "stale" if self.is_stale else "hit"
+
+    def get(self):
+        """
+        Return the current snapshot, or None when nothing has been loaded yet.
+        A stale snapshot is still returned immediately, after scheduling a
+        background refresh.
+        """
+        jobs = self._jobs
+        if jobs and self.is_stale:
+            self.refresh_in_background()
+        return jobs or None
+
+    def set(self, jobs: list, duration: float = 0.0) -> None:
+        """Atomically replace the snapshot and bump the generation."""
+        with self._lock:
+            self._jobs = jobs
+            self._refreshed_at = time.monotonic()
+            self.last_refresh_duration = duration
+            self.generation += 1
+
+        for listener in list(self._listeners):
+            try:
+                listener(jobs)
+            except Exception as e:
+                print(f"[Cache] Refresh listener {getattr(listener, '__name__', listener)} failed: {e}")
+
+    def add_listener(self, listener) -> None:
+        """
+        Register `listener(jobs)` to run after every swap, e.g. to rebuild
+        indexes derived from the job list.
+        """
+        self._listeners.append(listener)
+
+    def refresh_in_background(self) -> bool:
+        """Start one refresh thread unless one is already running."""
+        with self._lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+        threading.Thread(target=self._run_refresh, name="job-cache-refresh", daemon=True).start()
+        return True
+
+    def _run_refresh(self) -> None:
+        try:
+            _refresh_jobs()
+        except Exception as e:
+            print(f"[Cache] Background refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def stats(self) -> dict:
+        """Monitoring view of the cache."""
+        return {
+            "size": len(self._jobs),
+            "generation": self.generation,
+            "age_seconds": round(self.age, 3),
+            "ttl_seconds": self.ttl,
+            "stale": self.is_stale,
+            "refreshing": self._refreshing,
+            "last_refresh_seconds": round(self.last_refresh_duration, 3),
+        }
+
+
+job_cache = JobCache()
+Gauge("careerai_jobs_corpus_size", "Jobs in the current cached snapshot.", lambda: len(job_cache._jobs))
+Gauge("careerai_job_cache_generation", "Job cache snapshot generation.", lambda: job_cache.generation)
+_live_results = {}          # source name -> jobs returned by that source
+# Guards _live_results; merges are also installed under it, so they land in order
+_results_lock = threading.Lock()
+
+# Single-flight: the refresh currently running, shared by concurrent callers
+_inflight = None
+_inflight_lock = threading.Lock()
 
 # ─────────────────────────────────────────────────────────────────────────────
 # HELPERS
 # ─────────────────────────────────────────────────────────────────────────────
 
-SKILL_KEYWORDS = [
-    "Python", "Java", "JavaScript", "TypeScript", "SQL", "React", "Angular",
-    "Vue", "Node", "NodeJS", "SpringBoot", "Django", "Flask", "AWS", "Azure",
-    "GCP", "Docker", "Kubernetes", "Machine Learning", "Deep Learning", "AI",
-    "TensorFlow", "PyTorch", "HTML", "CSS", "MongoDB", "MySQL", "PostgreSQL",
-    "Redis", "Kafka", "REST API", "GraphQL", "Git", "Linux", "DSA", "C++", "C#",
-    "Kotlin", "Swift", "Android", "iOS", "Flutter", "Dart"
-]
-
 def _extract_skills_from_text(text: str) -> list:
     """Extract known skill keywords from a block of text (case-insensitive)."""
-    found = []
-    text_lower = text.lower()
-    for skill in SKILL_KEYWORDS:
-        if skill.lower() in text_lower and skill not in found:
-            found.append(skill)
-    # Fallback to utils extractor
-    if not found:
-        found = extract_skills(text) or ["Software Development"]
-    return found[:6]  # Return at most 6 skills per job
+    # At most 6 skills per job
+    return extract_skills(text, limit=6) or ["Software Development"]
+
+
+# Characters of a description shown in listings; the full text is kept aside
+# (see _split_full_descriptions) for fraud scoring and full-text search
+DESCRIPTION_PREVIEW_CHARS = 200
+
+_EMAIL_RE = re.compile(r"[\w.+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}")
+
+
+def _description_fields(desc: str) -> dict:
+    """
+    "description" (a preview) and, when that cuts the text short,
+    "full_description". The latter only lives on the per-source results and
+    is moved off the served jobs when they are merged.
+    """
+    if len(desc) <= DESCRIPTION_PREVIEW_CHARS:
+        return {"description": desc}
+    return {"description": desc[:DESCRIPTION_PREVIEW_CHARS] + "...", "full_description": desc}
+
+
+def _contact_email(desc: str) -> str:
+    """The first email address in a posting's text, or "" when it lists none."""
+    match = _EMAIL_RE.search(desc)
+    return match.group(0).rstrip(".") if match else ""
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared HTTP session: keep-alive connection pool for every upstream call
+# ─────────────────────────────────────────────────────────────────────────────
+
+HTTP_POOL_SIZE = 8
+
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE))
+_http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # SOURCE 1 – Adzuna API (India)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _fetch_adzuna_india() -> list:
+# Overridable to point the scraper at a local stand-in (see bench/upstream.py)
+ADZUNA_URL = os.environ.get("ADZUNA_URL", "https://api.adzuna.com/v1/api/jobs/in/search/{page}")
+ADZUNA_QUERIES = [
+    "software developer", "data scientist", "devops engineer", "frontend developer",
+    "backend developer", "machine learning engineer", "mobile developer", "data engineer",
+]
+ADZUNA_RESULTS_PER_PAGE = 50
+ADZUNA_MAX_PAGES = 10
+ADZUNA_PARALLELISM = 4      # concurrent search terms (each walks its pages in order)
+
+
+def _parse_adzuna_item(item: dict) -> dict:
+    """Convert one Adzuna search result into a CareerAI job dict."""
+    title    = item.get("title", "Software Developer")
+    company  = item.get("company", {}).get("display_name", "Indian Company")
+    location = item.get("location", {}).get("display_name", "India")
+    desc     = item.get("description", "")
+    skills   = _extract_skills_from_text(title + " " + desc)
+    return {
+        "title":    title,
+        "company":  company,
+        "location": location,
+        "skills":   skills,
+        "salary":   _format_salary(item.get("salary_min"), item.get("salary_max")),
+        "email":    _contact_email(desc),
+        "link":     item.get("redirect_url", "#"),
+        **_description_fields(desc),
+        "responsibilities": [],
+        "source":   "Adzuna",
+    }
+
+
+def _fetch_adzuna_query(what: str) -> list:
     """
-    Fetch real Indian job listings from the Adzuna public API.
-    No API key required for this demo endpoint; uses app_id/app_key if available.
+    Walk the result pages of one Adzuna search term, stopping at the first
+    empty or failed page or after ADZUNA_MAX_PAGES.
     """
     jobs = []
-    try:
-        # Adzuna India search endpoint
-        url = "https://api.adzuna.com/v1/api/jobs/in/search/1"
+    headers = {"User-Agent": "CareerAI/1.0"}
+    for page in range(1, ADZUNA_MAX_PAGES + 1):
         params = {
             "app_id": "demo",           # replace with real app_id for higher limits
             "app_key": "demo",          # replace with real app_key
-            "results_per_page": 20,
-            "what": "software developer",
+            "results_per_page": ADZUNA_RESULTS_PER_PAGE,
+            "what": what,
             "where": "India",
             "content-type": "application/json",
         }
-        headers = {"User-Agent": "CareerAI/1.0"}
-        response = requests.get(url, params=params, headers=headers, timeout=8)
+        try:
+            response = _http.get(ADZUNA_URL.format(page=page), params=params, headers=headers, timeout=8)
+            if response.status_code != 200:
+                break
+            results = response.json().get("results", [])
+        except Exception as e:
+            print(f"[Adzuna] '{what}' page {page} failed: {e}")
+            break
+        if not results:
+            break
+        jobs.extend(_parse_adzuna_item(item) for item in results)
+        if len(results) < ADZUNA_RESULTS_PER_PAGE:
+            break   # short page: nothing further
+    return jobs
 
-        if response.status_code == 200:
-            data = response.json()
-            for item in data.get("results", []):
-                title    = item.get("title", "Software Developer")
-                company  = item.get("company", {}).get("display_name", "Indian Company")
-                location = item.get("location", {}).get("display_name", "India")
-                desc     = item.get("description", "")
-                skills   = _extract_skills_from_text(title + " " + desc)
-                jobs.append({
-                    "title":    title,
-                    "company":  company,
-                    "location": location,
-                    "skills":   skills,
-                    "salary":   _format_salary(item.get("salary_min"), item.get("salary_max")),
-                    "email":    "careers@company.com",
-                    "link":     item.get("redirect_url", "#"),
-                    "description": desc[:200] + "..." if len(desc) > 200 else desc,
-                    "responsibilities": [],
-                })
+
+def _fetch_adzuna_india() -> list:
+    """
+    Fetch real Indian job listings from the Adzuna public API.
+    No API key required for this demo endpoint; uses app_id/app_key if available.
+
+    Every term in ADZUNA_QUERIES is paged through, ADZUNA_PARALLELISM terms at
+    a time, over the shared keep-alive session.
+    """
+    jobs = []
+    try:
+        with ThreadPoolExecutor(max_workers=ADZUNA_PARALLELISM, thread_name_prefix="adzuna") as pool:
+            for query_jobs in pool.map(_fetch_adzuna_query, ADZUNA_QUERIES):
+                jobs.extend(query_jobs)
+        if jobs:
             print(f"[Adzuna] Fetched {len(jobs)} jobs.")
     except Exception as e:
         print(f"[Adzuna] Failed: {e}")
@@ -105,6 +298,9 @@ def _format_salary(mn, mx) -> str:
 # SOURCE 2 – RemoteOK JSON Feed (India-friendly remote roles)
 # ─────────────────────────────────────────────────────────────────────────────
 
+REMOTEOK_URL = os.environ.get("REMOTEOK_URL", "https://remoteok.com/api")
+
+
 def _fetch_remoteok() -> list:
     """
     Fetch remote tech jobs from RemoteOK (free public JSON API).
@@ -112,9 +308,8 @@ def _fetch_remoteok() -> list:
     """
     jobs = []
     try:
-        url = "https://remoteok.com/api"
         headers = {"User-Agent": "CareerAI/1.0 (jobsearch)"}
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _http.get(REMOTEOK_URL, headers=headers, timeout=10)
 
         if response.status_code == 200:
             data = response.json()
@@ -135,10 +330,11 @@ def _fetch_remoteok() -> list:
                     "location": "Remote (India Eligible)",
                     "skills":   skills,
                     "salary":   item.get("salary", "Competitive"),
-                    "email":    "apply@remoteok.com",
+                    "email":    _contact_email(desc),
                     "link":     item.get("url", "#"),
-                    "description": desc[:200] + "..." if len(desc) > 200 else desc,
+                    **_description_fields(desc),
                     "responsibilities": [],
+                    "source":   "RemoteOK",
                 })
             print(f"[RemoteOK] Fetched {len(jobs)} jobs.")
     except Exception as e:
@@ -488,32 +684,29 @@ INDIAN_FALLBACK_JOBS = [
 # MAIN FUNCTION
 # ─────────────────────────────────────────────────────────────────────────────
 
-def get_jobs() -> list:
-    """
-    Returns a merged list of Indian job listings from:
-    1. Adzuna India API (live)
-    2. RemoteOK JSON API (live, India-eligible remote)
-    3. Indian demo job database (always available as fallback)
+# Each source's jobs carry its name in "source", so a stored snapshot can be
+# split back into per-source results on a warm start
+LIVE_SOURCES = [
+    ("Adzuna",   _fetch_adzuna_india),
+    ("RemoteOK", _fetch_remoteok),
+]
 
-    Returns at least 20 jobs.
-    """
-    global _cached_jobs
-    if _cached_jobs:
-        print("[Cache] Returning cached jobs.")
-        return _cached_jobs
+_fetch_pool = ThreadPoolExecutor(max_workers=len(LIVE_SOURCES), thread_name_prefix="job-fetch")
 
-    all_jobs = []
 
-    # ── Source 1: Adzuna India ──
-    adzuna_jobs = _fetch_adzuna_india()
-    all_jobs.extend(adzuna_jobs)
+def _merge_jobs() -> tuple:
+    """
+    Merge the live results received so far (in LIVE_SOURCES order) with the
+    Indian fallback DB, deduplicate by title+company and then by near-duplicate
+    content (see dedupe.py), and attach each job's fraud score.
 
-    # ── Source 2: RemoteOK ──
-    if len(all_jobs) < 10:
-        remoteok_jobs = _fetch_remoteok()
-        all_jobs.extend(remoteok_jobs)
+    Returns:
+        (jobs, full descriptions by job key), see _split_full_descriptions().
+    """
+    all_jobs = []
+    for name, _ in LIVE_SOURCES:
+        all_jobs.extend(_live_results.get(name, []))
 
-    # ── Source 3: Indian Fallback DB ──
     # Always append enough fallback jobs to ensure minimum of 20 total
     needed = max(0, 20 - len(all_jobs))
     fallback_slice = INDIAN_FALLBACK_JOBS[:max(needed, len(INDIAN_FALLBACK_JOBS))]
@@ -523,14 +716,211 @@ def get_jobs() -> list:
     seen = set()
     unique_jobs = []
     for job in all_jobs:
-        key = (job.get("title", "").lower(), job.get("company", "").lower())
+        key = job_key(job)
         if key not in seen:
             seen.add(key)
-            unique_jobs.append(job)
+            unique_jobs.append(_normalize_skills(job))
+    return _split_full_descriptions(score_jobs(drop_near_duplicates(unique_jobs)))
+
+
+def _split_full_descriptions(jobs: list) -> tuple:
+    """
+    Take "full_description" off the jobs, so responses, exports and stored
+    rows carry only the preview.
+
+    Returns:
+        (jobs without the field, job key -> full description)
+    """
+    served = []
+    texts = {}
+    for job in jobs:
+        if "full_description" in job:
+            job = dict(job)
+            texts[job_key(job)] = job.pop("full_description")
+        served.append(job)
+    return served, texts
+
+
+def _normalize_skills(job: dict) -> dict:
+    """
+    Resolve a job's skills to their canonical spellings ("Node", "NodeJS" ->
+    "Node.js"), so every index and counter sees one name per skill.
+    """
+    skills = job.get("skills", [])
+    canonical = skill_registry.canonical(skills)
+    if canonical == skills:
+        return job
+    return {**job, "skills": canonical}
+
+
+def _on_late_result(name: str, future) -> None:
+    """Fold a source that missed the deadline into the cache once it finishes."""
+    jobs = future.result()
+    if not jobs:
+        return
+    with _results_lock:
+        _live_results[name] = jobs
+        merged, texts = _merge_jobs()
+        _install(merged, texts, job_cache.last_refresh_duration)
+    print(f"[JobScraper] Late results from {name}; total jobs now {len(merged)}")
+
+
+def _install(jobs: list, texts: dict, duration: float) -> None:
+    """
+    Make a merged snapshot current and persist it. Called with _results_lock
+    held, in the same critical section as the merge, so a merge computed
+    earlier can never replace a newer one in the cache or the store.
+    """
+    set_full_descriptions(texts)
+    job_cache.set(jobs, duration)
+    _persist(jobs, texts)
+
+
+def _persist(jobs: list, texts: dict) -> None:
+    """Upsert a merged job list into the SQLite store (best effort)."""
+    try:
+        get_store().upsert_jobs(jobs, texts)
+    except Exception as e:
+        print(f"[JobStore] Failed to persist jobs: {e}")
+
+
+def _timed_fetch(name: str, fetch) -> list:
+    """Run one source's fetch, recording its duration and outcome."""
+    started = time.perf_counter()
+    jobs = []
+    try:
+        jobs = fetch()
+        return jobs
+    finally:
+        SOURCE_FETCH_DURATION.observe(time.perf_counter() - started, name)
+        SOURCE_FETCHES.inc(name, "success" if jobs else "failure")
+
+
+def _fetch_live_sources(deadline: float = FETCH_DEADLINE) -> None:
+    """
+    Run every live source at once and wait at most `deadline` seconds overall.
+    Sources that finish in time are stored in _live_results; the rest are
+    merged in by _on_late_result() when they complete. A source that fails
+    keeps its results from the previous refresh.
+    """
+    futures = {_fetch_pool.submit(_timed_fetch, name, fetch): name for name, fetch in LIVE_SOURCES}
+    done, pending = wait(futures, timeout=deadline)
+
+    with _results_lock:
+        for future in done:
+            jobs = future.result()
+            if jobs:
+                _live_results[futures[future]] = jobs
+
+    for future in pending:
+        name = futures[future]
+        print(f"[JobScraper] {name} missed the {deadline}s deadline; merging later.")
+        future.add_done_callback(lambda f, name=name: _on_late_result(name, f))
+
+
+def _refresh_jobs(only_if_empty: bool = False) -> list:
+    """
+    Fetch every source, merge, and swap the result into the cache.
+
+    Single-flight: if a refresh is already running, callers wait for it and
+    share its result instead of scraping the sources again. With
+    `only_if_empty`, a cache that got filled meanwhile is returned as-is.
+    """
+    global _inflight
+    with _inflight_lock:
+        if only_if_empty:
+            jobs = job_cache.get()
+            if jobs is not None:
+                return jobs
+        flight = _inflight
+        leader = flight is None
+        if leader:
+            flight = _inflight = Future()
+
+    if not leader:
+        return flight.result()
+
+    try:
+        started = time.monotonic()
+        _fetch_live_sources()
+        with _results_lock:
+            jobs, texts = _merge_jobs()
+            _install(jobs, texts, time.monotonic() - started)
+        print(f"[JobScraper] Total jobs loaded: {len(jobs)} (generation {job_cache.generation})")
+        JOB_CACHE_REFRESHES.inc("success")
+        flight.set_result(jobs)
+        return jobs
+    except BaseException as e:
+        JOB_CACHE_REFRESHES.inc("failure")
+        flight.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight = None
+
+
+def _seed_live_results(jobs: list, texts: dict) -> None:
+    """
+    Use a stored snapshot's jobs as each live source's previous results, so
+    a refresh during a source outage keeps them instead of falling back to
+    the demo DB. Sources that already returned results are left alone.
+    """
+    by_source = {}
+    for job in jobs:
+        text = texts.get(job_key(job))
+        by_source.setdefault(job.get("source"), []).append(
+            {**job, "full_description": text} if text else job)
+    with _results_lock:
+        for name, _ in LIVE_SOURCES:
+            if name not in _live_results and by_source.get(name):
+                _live_results[name] = by_source[name]
+
+
+def warm_start() -> int:
+    """
+    Seed the cache from the last snapshot in the job store and refresh the
+    live sources in the background. Returns the number of jobs loaded.
+    """
+    try:
+        store = get_store()
+        jobs = store.load_snapshot()
+        texts = store.load_full_descriptions()
+    except Exception as e:
+        print(f"[JobStore] Failed to load snapshot: {e}")
+        jobs, texts = [], {}
+
+    if jobs and job_cache.get() is None:
+        # Snapshots stored before the full text was kept aside still carry it
+        jobs, inline = _split_full_descriptions(jobs)
+        texts = {**texts, **inline}
+        set_full_descriptions(texts)
+        _seed_live_results(jobs, texts)
+        # Snapshots stored before fraud scoring existed get scored here
+        job_cache.set(score_jobs(jobs))
+        print(f"[JobStore] Warm start with {len(jobs)} stored jobs.")
+    job_cache.refresh_in_background()
+    return len(jobs)
+
+
+def get_jobs() -> list:
+    """
+    Returns a merged list of Indian job listings from:
+    1. Adzuna India API (live)
+    2. RemoteOK JSON API (live, India-eligible remote)
+    3. Indian demo job database (always available as fallback)
+
+    Live sources are fetched concurrently, so a cold call takes at most
+    FETCH_DEADLINE seconds instead of the sum of the source timeouts.
+    After CACHE_TTL seconds the cached list is refreshed in the background.
+    Concurrent cold calls share a single fetch.
+
+    Returns at least 20 jobs.
+    """
+    jobs = job_cache.get()
+    if jobs is not None:
+        return jobs
 
-    _cached_jobs = unique_jobs
-    print(f"[JobScraper] Total jobs loaded: {len(_cached_jobs)}")
-    return _cached_jobs
+    return _refresh_jobs(only_if_empty=True)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
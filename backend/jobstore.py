@@ -0,0 +1,241 @@
+"""
+jobstore.py
+-----------
+File-backed SQLite store for scraped job listings.
+
+Every refresh of the job cache upserts the merged list here, keyed on the
+same title+company key used for deduplication. On startup the last
+snapshot is loaded back so the process can serve jobs immediately while
+the live sources are refreshed in the background.
+
+Indexes on company, location and skill let endpoints query the store
+directly instead of scanning the in-memory list.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from utils import job_key
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "careerai_jobs.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key         TEXT PRIMARY KEY,
+    title       TEXT NOT NULL,
+    company     TEXT NOT NULL COLLATE NOCASE,
+    location    TEXT COLLATE NOCASE,
+    data        TEXT NOT NULL,
+    full_description TEXT,
+    snapshot    INTEGER NOT NULL,
+    position    INTEGER NOT NULL,
+    updated_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company  ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
+CREATE INDEX IF NOT EXISTS idx_jobs_snapshot ON jobs(snapshot, position);
+
+CREATE TABLE IF NOT EXISTS job_skills (
+    job_key TEXT NOT NULL REFERENCES jobs(key) ON DELETE CASCADE,
+    skill   TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (job_key, skill)
+);
+CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills(skill);
+
+CREATE TABLE IF NOT EXISTS meta (
+    name  TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _encode_key(job) -> str:
+    """Flatten the (title, company) dedup key into a single TEXT column."""
+    title, company = job_key(job)
+    return f"{title}\x1f{company}"
+
+
+class JobStore:
+    """
+    Thin wrapper around one SQLite connection shared by all threads.
+    Writes are serialized with a lock; WAL mode keeps readers unblocked.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "full_description" not in columns:
+            # Stores created before full descriptions were kept outside the job JSON
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN full_description TEXT")
+
+    # ──────────────────────────────────────────────
+    # Writes
+    # ──────────────────────────────────────────────
+    def upsert_jobs(self, jobs: list, full_descriptions: dict = None) -> int:
+        """
+        Insert or update every job and mark them as the latest snapshot.
+        Rows from older snapshots are kept, so the store accumulates history.
+        `full_descriptions` (job key -> text) is stored beside the job JSON,
+        so exports and snapshot loads keep serving only the preview.
+
+        Returns:
+            The new snapshot number.
+        """
+        now = time.time()
+        full_descriptions = full_descriptions or {}
+        with self._lock, self._conn:
+            snapshot = self._latest_snapshot() + 1
+            rows = []
+            skill_rows = []
+            for position, job in enumerate(jobs):
+                key = _encode_key(job)
+                rows.append((
+                    key,
+                    job.get("title", ""),
+                    job.get("company", ""),
+                    job.get("location", ""),
+                    json.dumps(job, ensure_ascii=False),
+                    full_descriptions.get(job_key(job)),
+                    snapshot,
+                    position,
+                    now,
+                ))
+                skill_rows.extend((key, skill) for skill in dict.fromkeys(job.get("skills", [])))
+
+            self._conn.executemany(
+                """
+                INSERT INTO jobs (key, title, company, location, data, full_description,
+                                  snapshot, position, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    title = excluded.title,
+                    company = excluded.company,
+                    location = excluded.location,
+                    data = excluded.data,
+                    full_description = excluded.full_description,
+                    snapshot = excluded.snapshot,
+                    position = excluded.position,
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+            self._conn.executemany(
+                "DELETE FROM job_skills WHERE job_key = ?", [(row[0],) for row in rows]
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO job_skills (job_key, skill) VALUES (?, ?)", skill_rows
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('snapshot', ?)", (str(snapshot),)
+            )
+        return snapshot
+
+    # ──────────────────────────────────────────────
+    # Reads
+    # ──────────────────────────────────────────────
+    def _latest_snapshot(self) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE name = 'snapshot'").fetchone()
+        return int(row[0]) if row else 0
+
+    def load_snapshot(self) -> list:
+        """Return the jobs of the latest snapshot in their original order."""
+        with self._lock:
+            snapshot = self._latest_snapshot()
+            cursor = self._conn.execute(
+                "SELECT data FROM jobs WHERE snapshot = ? ORDER BY position", (snapshot,)
+            )
+            return [json.loads(data) for (data,) in cursor]
+
+    def load_full_descriptions(self) -> dict:
+        """Job key -> full description for the latest snapshot's jobs that have one."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT key, full_description FROM jobs WHERE snapshot = ? AND full_description IS NOT NULL",
+                (self._latest_snapshot(),),
+            )
+            return {tuple(key.split("\x1f", 1)): text for key, text in cursor}
+
+    def iter_jobs(self, latest_only: bool = True, batch_size: int = 500):
+        """
+        Yield stored jobs one at a time without loading them all in memory.
+
+        Uses a separate read-only connection (WAL lets it run alongside
+        writers), so the store lock is not held while the caller consumes.
+
+        Args:
+            latest_only: Only jobs of the latest snapshot, in listing order;
+                         otherwise every job ever stored, newest snapshot first.
+            batch_size:  Rows fetched from SQLite per round trip.
+        """
+        return self._iter_query("", "", (), latest_only, batch_size)
+
+    def jobs_by_company(self, company: str, latest_only: bool = True):
+        """Stored jobs for a company (case-insensitive), streamed like iter_jobs()."""
+        return self._iter_query("", "jobs.company = ?", (company,), latest_only)
+
+    def jobs_by_location(self, location: str, latest_only: bool = True):
+        """Stored jobs in a location (case-insensitive), streamed like iter_jobs()."""
+        return self._iter_query("", "jobs.location = ?", (location,), latest_only)
+
+    def jobs_by_skill(self, skill: str, latest_only: bool = True):
+        """Stored jobs that list a skill (case-insensitive), streamed like iter_jobs()."""
+        return self._iter_query("JOIN job_skills ON job_skills.job_key = jobs.key", "job_skills.skill = ?",
+                                (skill,), latest_only)
+
+    def _iter_query(self, join: str, where: str, params: tuple, latest_only: bool, batch_size: int = 500):
+        """Stream the job JSON of `SELECT ... FROM jobs {join} WHERE {where}` over a read-only connection."""
+        conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        try:
+            conditions = [where] if where else []
+            if latest_only:
+                row = conn.execute("SELECT value FROM meta WHERE name = 'snapshot'").fetchone()
+                conditions.append("jobs.snapshot = ?")
+                params += (int(row[0]) if row else 0,)
+                order = "jobs.position"
+            else:
+                order = "jobs.snapshot DESC, jobs.position"
+            sql = f"SELECT jobs.data FROM jobs {join}"
+            if conditions:
+                sql += " WHERE " + " AND ".join(conditions)
+            cursor = conn.execute(f"{sql} ORDER BY {order}", params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for (data,) in rows:
+                    yield json.loads(data)
+        finally:
+            conn.close()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> JobStore:
+    """
+    Return the process-wide store, opening it on first use.
+    The database path can be overridden with JOB_STORE_PATH.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = JobStore(os.environ.get("JOB_STORE_PATH", DEFAULT_DB_PATH))
+        return _store
@@ -0,0 +1,168 @@
+"""
+metrics.py
+----------
+In-process metrics exposed at /metrics in the Prometheus text format.
+
+Counters and histograms are plain dicts keyed by label values, so
+recording is a dict lookup and an add under a lock (plus one bisect for a
+histogram). Nothing is formatted until /metrics is scraped. Gauges are
+callbacks read at scrape time, so they cost nothing in between.
+
+Metrics defined here are shared by the app, the scraper and the resume
+pipeline; this module imports nothing from them.
+"""
+
+import bisect
+import threading
+
+# Seconds; suits both sub-millisecond cached reads and multi-second fetches
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_registry = []
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter, optionally labelled."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> list:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}" for labels, value in items]
+
+
+class Histogram:
+    """Bucketed distribution (Prometheus histogram), optionally labelled."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (),
+                 buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}       # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def observe(self, value: float, *labels) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def samples(self) -> list:
+        with self._lock:
+            items = sorted((labels, (list(s[0]), s[1], s[2])) for labels, s in self._series.items())
+        lines = []
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket
+                le = 'le="' + _number(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {repr(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class Gauge:
+    """Value read from `read()` at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, read):
+        self.name = name
+        self.documentation = documentation
+        self.read = read
+        _registry.append(self)
+
+    def samples(self) -> list:
+        try:
+            return [f"{self.name} {_number(self.read())}"]
+        except Exception as e:
+            print(f"[Metrics] Gauge {self.name} failed: {e}")
+            return []
+
+
+def render() -> str:
+    """Every registered metric in the Prometheus text exposition format."""
+    lines = []
+    for metric in _registry:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.samples())
+    return "\n".join(lines) + "\n"
+
+
+# ──────────────────────────────────────────────
+# Shared metrics
+# ──────────────────────────────────────────────
+HTTP_REQUEST_DURATION = Histogram(
+    "careerai_http_request_duration_seconds",
+    "Time to produce a response (headers, for streamed bodies), by route template.",
+    ("method", "route"),
+)
+HTTP_REQUESTS = Counter(
+    "careerai_http_requests_total", "HTTP responses by route template and status.",
+    ("method", "route", "status"),
+)
+SOURCE_FETCH_DURATION = Histogram(
+    "careerai_source_fetch_duration_seconds", "Duration of one fetch of a live job source.",
+    ("source",),
+)
+SOURCE_FETCHES = Counter(
+    "careerai_source_fetches_total",
+    "Live job source fetches by outcome (failure: raised or returned no jobs).",
+    ("source", "outcome"),
+)
+JOB_CACHE_REQUESTS = Counter(
+    "careerai_job_cache_requests_total",
+    "Requests to job-data routes by job cache state: hit (fresh), stale (served while refreshing) or miss (empty).",
+    ("result",),
+)
+JOB_CACHE_REFRESHES = Counter(
+    "careerai_job_cache_refreshes_total", "Job cache refreshes by outcome.", ("outcome",),
+)
+RESUME_PARSE_DURATION = Histogram(
+    "careerai_resume_parse_duration_seconds",
+    "Resume text extraction time by file format, including any wait for a parser worker.",
+    ("format",),
+)
@@ -0,0 +1,78 @@
+"""
+response_cache.py
+-----------------
+Pre-serialized, ETag-tagged JSON responses for read-mostly endpoints.
+
+The body for an endpoint is serialized once per source object (the job
+snapshot, the dashboard views, ...) and reused until that object is
+replaced by a cache refresh. Every response carries a strong ETag, and an
+If-None-Match that matches it, weakly or strongly, is answered with 304 and
+no body.
+
+orjson is used for serialization when installed, otherwise the standard
+json module.
+"""
+
+import hashlib
+import json
+import threading
+
+from flask import Response, request
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes with the fastest available encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class SerializedBody:
+    """JSON bytes plus their strong ETag, tied to the object they came from."""
+
+    __slots__ = ("source", "body", "etag")
+
+    def __init__(self, source, body: bytes):
+        self.source = source
+        self.body = body
+        self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+_bodies = {}
+_bodies_lock = threading.Lock()
+
+
+def serialized(name: str, source, build=None) -> SerializedBody:
+    """
+    Return the cached body for `name` if it was built from this very
+    `source` object; otherwise serialize `build()` (or `source` itself).
+    """
+    entry = _bodies.get(name)
+    if entry is not None and entry.source is source:
+        return entry
+
+    body = dumps(build() if build is not None else source)
+    entry = SerializedBody(source, body)
+    with _bodies_lock:
+        _bodies[name] = entry
+    return entry
+
+
+def json_response(entry: SerializedBody) -> Response:
+    """
+    Build the HTTP response for a serialized body, honouring If-None-Match.
+    """
+    # Weak comparison (RFC 9110): proxies that re-encode the body send W/"..."
+    if request.if_none_match.contains_weak(entry.etag):
+        response = Response(status=304)
+    else:
+        response = Response(entry.body, mimetype="application/json")
+    response.set_etag(entry.etag)
+    # Clients and CDNs may store the body but must revalidate it each time
+    response.headers["Cache-Control"] = "no-cache"
+    return response
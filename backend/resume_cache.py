@@ -0,0 +1,97 @@
+"""
+resume_cache.py
+---------------
+Content-addressed cache for resume uploads.
+
+Uploads are keyed by a SHA-256 of their bytes, so re-uploading the same
+resume skips text extraction and skill detection entirely. Match results
+are cached separately, keyed by the same hash plus the job cache
+generation and scoring mode, so they expire naturally when the jobs change.
+
+Both caches are bounded LRUs. When RESUME_CACHE_DIR is set, extraction
+entries evicted from memory spill to JSON files there and are promoted
+back on the next hit.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+EXTRACTION_CACHE_SIZE = 512
+MATCH_CACHE_SIZE = 2048
+
+
+def content_hash(data: bytes) -> str:
+    """Hex SHA-256 of the uploaded bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe LRU mapping with an optional on-disk spill directory.
+    Values must be JSON-serializable when `spill_dir` is used.
+    """
+
+    def __init__(self, maxsize: int, spill_dir: str = None):
+        self.maxsize = maxsize
+        self.spill_dir = spill_dir
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def _spill_path(self, key: str) -> str:
+        return os.path.join(self.spill_dir, f"{key}.json")
+
+    def get(self, key):
+        """Return the cached value or None."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+
+        if self.spill_dir:
+            try:
+                with open(self._spill_path(key), encoding="utf-8") as f:
+                    value = json.load(f)
+            except (OSError, ValueError):
+                value = None
+            if value is not None:
+                self.put(key, value)
+                with self._lock:
+                    self.hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, value) -> None:
+        evicted = []
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                evicted.append(self._data.popitem(last=False))
+
+        if self.spill_dir:
+            for old_key, old_value in evicted:
+                try:
+                    with open(self._spill_path(old_key), "w", encoding="utf-8") as f:
+                        json.dump(old_value, f)
+                except (OSError, TypeError) as e:
+                    print(f"[ResumeCache] Failed to spill {old_key}: {e}")
+
+    def stats(self) -> dict:
+        return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+# Hash -> {"text": ..., "skills": [...]}
+extraction_cache = LRUCache(EXTRACTION_CACHE_SIZE, os.environ.get("RESUME_CACHE_DIR") or None)
+# "hash:generation:scoring" -> matching jobs
+match_cache = LRUCache(MATCH_CACHE_SIZE)
@@ -1,23 +1,27 @@
-from jobscraper import get_jobs
+from jobindex import get_index
+from skills import skill_registry
 
 def match_resume(user_skills):
     """
     Matches user's skills with available jobs.
     Return matching jobs based on intersected skills.
     """
-    matched_jobs = []
-    all_jobs = get_jobs()
+    return _match_with_index(get_index(), user_skills)
 
-    # Convert user skills to lowercase for resilient matching
-    user_skills_lower = [skill.lower() for skill in user_skills]
 
-    for job in all_jobs:
-        job_skills_lower = [skill.lower() for skill in job.get("skills", [])]
-        
-        # Check if there is any intersection between user skills and job skills
-        for user_skill in user_skills_lower:
-            if user_skill in job_skills_lower:
-                matched_jobs.append(job)
-                break # Move to the next job once a match is found to avoid duplicates
+def match_resume_batch(skill_sets):
+    """
+    Matches many skill lists at once against the same job snapshot.
+    Returns one list of matching jobs per skill list, in input order.
+    """
+    index = get_index()
+    return [_match_with_index(index, user_skills) for user_skills in skill_sets]
+
+
+def _match_with_index(index, user_skills):
+    # Resolve user skills (and aliases) to canonical skill ids
+    skill_ids = skill_registry.lookup_all(user_skills)
 
-    return matched_jobs
+    # Merge the posting lists; job ids keep the original listing order
+    matched_ids = sorted(index.candidates(skill_ids))
+    return [index.jobs[job_id] for job_id in matched_ids]
@@ -0,0 +1,213 @@
+"""
+resume_parser.py
+----------------
+Out-of-process PDF / DOCX text extraction for resume uploads.
+
+Parsing runs in a bounded pool of worker processes so a pathological
+document can neither hold the GIL nor pin a request thread:
+  - each document gets a hard timeout; a worker that overruns it is killed
+    and replaced,
+  - PDFs are read up to MAX_PDF_PAGES pages,
+  - at most PARSE_WORKERS documents parse at once and PARSE_QUEUE_DEPTH more
+    may wait; beyond that ParserBusyError is raised (HTTP 503).
+
+Workers are started through a fork server where the platform has one, and
+spawned elsewhere; never forked straight from the server process, whose
+request, refresh and executor threads could leave locks held in the child.
+Either way a worker imports this module, which is why its imports stay light.
+"""
+
+import io
+import multiprocessing
+import os
+import queue
+import threading
+
+PARSE_WORKERS = int(os.environ.get("RESUME_PARSE_WORKERS", os.cpu_count() or 2))
+PARSE_QUEUE_DEPTH = int(os.environ.get("RESUME_PARSE_QUEUE_DEPTH", 16))
+PARSE_TIMEOUT = float(os.environ.get("RESUME_PARSE_TIMEOUT", 10))
+MAX_PDF_PAGES = 30
+
+
+class ParserBusyError(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class ParseTimeoutError(RuntimeError):
+    """Raised when a document takes longer than PARSE_TIMEOUT to parse."""
+
+
+# ──────────────────────────────────────────────
+# Parsers (run inside the worker processes)
+# ──────────────────────────────────────────────
+def extract_pdf(data: bytes, max_pages: int = MAX_PDF_PAGES) -> str:
+    """Extract text from the first `max_pages` pages of a PDF using PyPDF2."""
+    try:
+        import PyPDF2
+        reader = PyPDF2.PdfReader(io.BytesIO(data))
+        parts = []
+        for page in reader.pages[:max_pages]:
+            page_text = page.extract_text()
+            if page_text:
+                parts.append(page_text)
+        return "\n".join(parts).strip()
+    except ImportError:
+        raise ImportError("PyPDF2 is not installed. Run: pip install PyPDF2")
+    except Exception as e:
+        raise RuntimeError(f"Failed to read PDF: {e}")
+
+
+def extract_docx(data: bytes) -> str:
+    """Extract text from a DOCX file using python-docx."""
+    try:
+        from docx import Document
+        doc = Document(io.BytesIO(data))
+        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+        return "\n".join(paragraphs)
+    except ImportError:
+        raise ImportError("python-docx is not installed. Run: pip install python-docx")
+    except Exception as e:
+        raise RuntimeError(f"Failed to read DOCX: {e}")
+
+
+_PARSERS = {
+    "pdf": extract_pdf,
+    "docx": extract_docx,
+}
+
+
+def _worker_loop(conn) -> None:
+    """Serve parse requests from the parent until the pipe closes."""
+    while True:
+        try:
+            kind, data = conn.recv()
+        except (EOFError, OSError):
+            break
+        try:
+            conn.send((True, _PARSERS[kind](data)))
+        except (ImportError, RuntimeError) as e:
+            conn.send((False, e))
+        except Exception as e:
+            conn.send((False, RuntimeError(str(e))))
+
+
+# ──────────────────────────────────────────────
+# Worker pool (parent side)
+# ──────────────────────────────────────────────
+class _Worker:
+    """One long-lived parser process and the parent's end of its pipe."""
+
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_loop, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def run(self, kind: str, data: bytes, timeout: float) -> str:
+        self.conn.send((kind, data))
+        if not self.conn.poll(timeout):
+            raise ParseTimeoutError(f"Parsing the {kind.upper()} took longer than {timeout:g}s.")
+        ok, value = self.conn.recv()
+        if not ok:
+            raise value
+        return value
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join(1)
+        self.conn.close()
+
+
+class ParserPool:
+    """
+    Bounded pool of parser processes with per-document hard timeouts.
+    Workers are started lazily, up to `workers`.
+    """
+
+    def __init__(self, workers: int = PARSE_WORKERS, queue_depth: int = PARSE_QUEUE_DEPTH,
+                 timeout: float = PARSE_TIMEOUT):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self._ctx = multiprocessing.get_context(method)
+        self._idle = queue.LifoQueue()
+        self._started = 0
+        self._lock = threading.Lock()
+        # Running + waiting documents
+        self._slots = threading.BoundedSemaphore(self.workers + max(0, queue_depth))
+
+    def _checkout(self) -> _Worker:
+        with self._lock:
+            if self._idle.empty() and self._started < self.workers:
+                self._started += 1
+                spawn = True
+            else:
+                spawn = False
+        if spawn:
+            try:
+                return _Worker(self._ctx)
+            except Exception:
+                with self._lock:
+                    self._started -= 1
+                raise
+        return self._idle.get()
+
+    def _retire(self, worker: _Worker) -> None:
+        """Kill a hung or crashed worker and start its replacement in the background."""
+        worker.kill()
+        threading.Thread(target=self._replace, name="resume-parser-respawn", daemon=True).start()
+
+    def _replace(self) -> None:
+        try:
+            self._idle.put(_Worker(self._ctx))
+        except Exception as e:
+            print(f"[ResumeParser] Failed to start replacement worker: {e}")
+            with self._lock:
+                self._started -= 1
+
+    def parse(self, kind: str, data: bytes, block: bool = False) -> str:
+        """
+        Extract text from a document in a worker process.
+
+        With `block`, wait for room in the queue instead of raising
+        ParserBusyError.
+
+        Raises:
+            ParserBusyError:   too many documents in flight.
+            ParseTimeoutError: the document exceeded the timeout.
+            ImportError / RuntimeError: from the parser itself.
+        """
+        if kind not in _PARSERS:
+            raise ValueError(f"No out-of-process parser for '{kind}'.")
+        if not self._slots.acquire(blocking=block):
+            raise ParserBusyError("Resume parser is busy. Please retry shortly.")
+        try:
+            worker = self._checkout()
+            try:
+                result = worker.run(kind, data, self.timeout)
+            except ParseTimeoutError:
+                self._retire(worker)
+                raise
+            except (EOFError, OSError, BrokenPipeError) as e:
+                self._retire(worker)
+                raise RuntimeError(f"Resume parser crashed: {e}")
+            except BaseException:
+                self._idle.put(worker)
+                raise
+            self._idle.put(worker)
+            return result
+        finally:
+            self._slots.release()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_parser_pool() -> ParserPool:
+    """Process-wide parser pool, created on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ParserPool()
+        return _pool
@@ -8,23 +8,15 @@ Supported formats: PDF, DOCX, TXT
 """
 
 import io
-from jobscraper import get_jobs
-
-# ──────────────────────────────────────────────
-# Skill keyword list
-# ──────────────────────────────────────────────
-SKILLS_LIST = [
-    "Python", "Java", "SQL", "React", "SpringBoot",
-    "Machine Learning", "AWS", "HTML", "CSS", "JavaScript",
-    "C++", "Django", "Flask", "NodeJS", "Power BI",
-    "Excel", "TensorFlow", "Docker", "Kubernetes", "Git",
-    "MongoDB", "PostgreSQL", "MySQL", "TypeScript", "Angular",
-    "Vue", "Kotlin", "Swift", "Go", "Rust",
-    "PyTorch", "Pandas", "NumPy", "Scikit-learn", "Hadoop",
-    "Spark", "Tableau", "Linux", "Bash", "REST API",
-    "GraphQL", "Redis", "Elasticsearch", "Figma", "Flutter",
-]
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from jobindex import SCORING_MODES, get_index
+from metrics import RESUME_PARSE_DURATION
+from resume_cache import content_hash, extraction_cache, match_cache
+from resume_parser import PARSE_WORKERS, ParserBusyError, get_parser_pool
+from skills import skill_matcher, skill_registry
 
 # ──────────────────────────────────────────────
 # 1. TEXT EXTRACTION
@@ -40,58 +32,52 @@ def extract_text(file) -> str:
     Returns:
         Extracted text as a string.
     """
-    filename = file.filename.lower()
+    return extract_text_from_bytes(file.filename, file.read())
+
+
+def extract_text_from_bytes(filename: str, data: bytes, wait: bool = False) -> str:
+    """
+    Extract raw text from the contents of a resume file.
+    PDF and DOCX are parsed in the out-of-process parser pool
+    (see resume_parser.py); TXT is decoded in place.
+
+    With `wait`, a busy parser pool is waited on instead of raising
+    ParserBusyError (used by batch screening).
+    """
+    lowered = filename.lower()
 
     # ── PDF ──
-    if filename.endswith(".pdf"):
-        return _extract_from_pdf(file)
+    if lowered.endswith(".pdf"):
+        return _timed_parse("pdf", get_parser_pool().parse, "pdf", data, block=wait)
 
     # ── DOCX ──
-    elif filename.endswith(".docx"):
-        return _extract_from_docx(file)
+    elif lowered.endswith(".docx"):
+        return _timed_parse("docx", get_parser_pool().parse, "docx", data, block=wait)
 
     # ── TXT ──
-    elif filename.endswith(".txt"):
-        return _extract_from_txt(file)
+    elif lowered.endswith(".txt"):
+        return _timed_parse("txt", _extract_from_txt, data)
 
     else:
-        raise ValueError(f"Unsupported file type: '{file.filename}'. Please upload PDF, DOCX, or TXT.")
-
-
-def _extract_from_pdf(file) -> str:
-    """Extract text from a PDF file using PyPDF2."""
-    try:
-        import PyPDF2
-        reader = PyPDF2.PdfReader(io.BytesIO(file.read()))
-        text = ""
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"
-        return text.strip()
-    except ImportError:
-        raise ImportError("PyPDF2 is not installed. Run: pip install PyPDF2")
-    except Exception as e:
-        raise RuntimeError(f"Failed to read PDF: {e}")
+        raise ValueError(f"Unsupported file type: '{filename}'. Please upload PDF, DOCX, or TXT.")
 
 
-def _extract_from_docx(file) -> str:
-    """Extract text from a DOCX file using python-docx."""
+def _timed_parse(fmt: str, parse, *args, **kwargs) -> str:
+    """Run a parser, recording its duration per format (not for busy rejections)."""
+    started = time.perf_counter()
     try:
-        from docx import Document
-        doc = Document(io.BytesIO(file.read()))
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-        return "\n".join(paragraphs)
-    except ImportError:
-        raise ImportError("python-docx is not installed. Run: pip install python-docx")
-    except Exception as e:
-        raise RuntimeError(f"Failed to read DOCX: {e}")
+        return parse(*args, **kwargs)
+    except ParserBusyError:
+        started = None
+        raise
+    finally:
+        if started is not None:
+            RESUME_PARSE_DURATION.observe(time.perf_counter() - started, fmt)
 
 
-def _extract_from_txt(file) -> str:
+def _extract_from_txt(raw: bytes) -> str:
     """Extract text from a plain TXT file."""
     try:
-        raw = file.read()
         # Try UTF-8 first, fall back to latin-1
         try:
             return raw.decode("utf-8").strip()
@@ -114,53 +100,182 @@ def extract_skills(text: str) -> list:
     Returns:
         List of matched skill strings (deduplicated, ordered).
     """
-    text_lower = text.lower()
-    found = []
-
-    for skill in SKILLS_LIST:
-        # Match whole-word-ish (handles e.g. "C++" and "NodeJS")
-        if skill.lower() in text_lower:
-            found.append(skill)
-
-    # Deduplicate while preserving order
-    return list(dict.fromkeys(found))
+    return skill_matcher.extract(text)
 
 
 # ──────────────────────────────────────────────
 # 3. JOB MATCHING
 # ──────────────────────────────────────────────
-def match_jobs(skills: list) -> list:
+def match_jobs(skills: list, scoring: str = "overlap", top_k: int = 10, index=None) -> list:
     """
     Match user skills against the jobs database and return
-    relevant job listings sorted by number of skill matches.
+    relevant job listings sorted by match score.
 
     Args:
-        skills: List of skills extracted from the user's resume.
+        skills:  List of skills extracted from the user's resume.
+        scoring: "overlap" (number of shared skills), "jaccard" or
+                 "coverage" (share of the job's skills the user has).
+        top_k:   Number of jobs to return.
+        index:   JobIndex to match against (defaults to the current one).
 
     Returns:
         List of matching job dicts with title, company, location,
         matched_skills, and match_score.
     """
-    all_jobs = get_jobs()
-    skills_lower = {s.lower() for s in skills}
-
-    scored = []
-    for job in all_jobs:
-        job_skills = [s.lower() for s in job.get("skills", [])]
-        matched = [s for s in job_skills if s in skills_lower]
-        if matched:
-            scored.append({
-                "title":          job.get("title", "Unknown"),
-                "company":        job.get("company", "Unknown"),
-                "location":       job.get("location", "Unknown"),
-                "matched_skills": [s.capitalize() for s in matched],
-                "match_score":    len(matched),
-                "salary":         job.get("salary", "Competitive"),
-                "link":           job.get("link", ""),
-            })
-
-    # Sort by most matches first
-    scored.sort(key=lambda x: x["match_score"], reverse=True)
-
-    # Return top 10
-    return scored[:10]
+    if scoring not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode '{scoring}'. Use one of: {', '.join(SCORING_MODES)}.")
+
+    if index is None:
+        index = get_index()
+    skill_ids = set(skill_registry.lookup_all(skills))
+
+    results = []
+    for job_id, score in index.top_k(skill_ids, top_k, scoring):
+        job = index.jobs[job_id]
+        matched = [skill_id for skill_id in index.job_skills[job_id] if skill_id in skill_ids]
+        results.append({
+            "title":          job.get("title", "Unknown"),
+            "company":        job.get("company", "Unknown"),
+            "location":       job.get("location", "Unknown"),
+            "matched_skills": [skill_registry.name(skill_id) for skill_id in matched],
+            "match_score":    score,
+            "salary":         job.get("salary", "Competitive"),
+            "link":           job.get("link", ""),
+        })
+    return results
+
+
+# ──────────────────────────────────────────────
+# 4. FULL PIPELINE (CACHED)
+# ──────────────────────────────────────────────
+def analyze_resume(filename: str, data: bytes, scoring: str = "overlap", index=None,
+                   wait: bool = False) -> dict:
+    """
+    Extract text and skills from a resume and match them against the jobs.
+    Results are cached by content hash (see resume_cache.py), so re-uploading
+    the same file skips parsing, and matching too while the jobs are unchanged.
+
+    Args:
+        index: JobIndex snapshot to match against (defaults to the current one).
+        wait:  Wait for a free parser instead of failing when it is busy.
+
+    Returns:
+        {"text": ..., "skills": [...], "jobs": [...]}
+    """
+    # The extension decides the parser, so it is part of the key
+    digest = content_hash(data) + "." + filename.lower().rsplit(".", 1)[-1]
+
+    extracted = extraction_cache.get(digest)
+    if extracted is None:
+        text = extract_text_from_bytes(filename, data, wait)
+        extracted = {"text": text, "skills": extract_skills(text) if text.strip() else []}
+        extraction_cache.put(digest, extracted)
+
+    if not extracted["text"].strip():
+        return {"text": extracted["text"], "skills": [], "jobs": []}
+
+    if index is None:
+        index = get_index()
+    match_key = f"{digest}:{index.generation}:{scoring}"
+    jobs = match_cache.get(match_key)
+    if jobs is None:
+        jobs = match_jobs(extracted["skills"], scoring, index=index)
+        match_cache.put(match_key, jobs)
+
+    return {"text": extracted["text"], "skills": extracted["skills"], "jobs": jobs}
+
+
+# ──────────────────────────────────────────────
+# 5. BATCH SCREENING
+# ──────────────────────────────────────────────
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".txt")
+MAX_BATCH_FILES = 500
+MAX_FILE_BYTES = 10 * 1024 * 1024
+# Cap on the summed (decompressed) size of a batch, so a small zip cannot expand without bound
+MAX_BATCH_BYTES = 200 * 1024 * 1024
+
+_batch_pool = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="resume-batch")
+
+
+def expand_uploads(uploads) -> list:
+    """
+    Turn uploaded (filename, bytes) pairs into the list of resumes to screen,
+    unpacking any .zip archives. Directories, hidden files and unsupported
+    types inside archives are skipped.
+
+    Raises:
+        ValueError: too many files, an oversized file or batch, or a broken archive.
+    """
+    resumes = []
+    total_bytes = 0
+    for filename, data in uploads:
+        if filename.lower().endswith(".zip"):
+            try:
+                with zipfile.ZipFile(io.BytesIO(data)) as archive:
+                    entries = []
+                    for info in archive.infolist():
+                        name = info.filename.rsplit("/", 1)[-1]
+                        if info.is_dir() or name.startswith(".") or not name.lower().endswith(SUPPORTED_EXTENSIONS):
+                            continue
+                        if info.file_size > MAX_FILE_BYTES:
+                            raise ValueError(f"'{info.filename}' in '{filename}' is larger than {MAX_FILE_BYTES} bytes.")
+                        entries.append(info)
+                        if len(resumes) + len(entries) > MAX_BATCH_FILES:
+                            raise ValueError(f"Too many resumes in one batch (max {MAX_BATCH_FILES}).")
+
+                    # Check the declared sizes before decompressing anything
+                    total_bytes += sum(info.file_size for info in entries)
+                    if total_bytes > MAX_BATCH_BYTES:
+                        raise ValueError(f"Batch is larger than {MAX_BATCH_BYTES} bytes uncompressed.")
+                    for info in entries:
+                        resumes.append((info.filename, archive.read(info)))
+            except zipfile.BadZipFile as e:
+                raise ValueError(f"'{filename}' is not a valid zip archive: {e}")
+        else:
+            if len(data) > MAX_FILE_BYTES:
+                raise ValueError(f"'{filename}' is larger than {MAX_FILE_BYTES} bytes.")
+            total_bytes += len(data)
+            if total_bytes > MAX_BATCH_BYTES:
+                raise ValueError(f"Batch is larger than {MAX_BATCH_BYTES} bytes uncompressed.")
+            resumes.append((filename, data))
+
+        if len(resumes) > MAX_BATCH_FILES:
+            raise ValueError(f"Too many resumes in one batch (max {MAX_BATCH_FILES}).")
+    return resumes
+
+
+def screen_resumes(resumes: list, scoring: str = "overlap"):
+    """
+    Screen many resumes against one shared job snapshot.
+
+    Files are parsed in parallel (PDF/DOCX in the parser process pool) and
+    matched with the same JobIndex. Results are yielded as each resume
+    finishes, so one slow document does not hold up the rest.
+
+    Yields:
+        {"filename", "extracted_skills", "matching_jobs"} or
+        {"filename", "error"} per resume.
+    """
+    if scoring not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode '{scoring}'. Use one of: {', '.join(SCORING_MODES)}.")
+
+    index = get_index()
+    futures = {
+        _batch_pool.submit(analyze_resume, filename, data, scoring, index, True): filename
+        for filename, data in resumes
+    }
+    for future in as_completed(futures):
+        filename = futures[future]
+        try:
+            result = future.result()
+        except Exception as e:
+            yield {"filename": filename, "error": str(e)}
+            continue
+        if not result["text"].strip():
+            yield {"filename": filename, "error": "Could not extract any text from the file."}
+            continue
+        yield {
+            "filename": filename,
+            "extracted_skills": result["skills"],
+            "matching_jobs": result["jobs"],
+        }
@@ -0,0 +1,168 @@
+"""
+retrieval.py
+------------
+BM25 ranked retrieval of jobs against free text (e.g. a full resume).
+
+A sparse BM25 index over job titles, skills and full descriptions is rebuilt
+once per job cache refresh (see JobCache.add_listener). Each posting
+stores the job's precomputed BM25 term weight, so scoring a query is a
+sparse dot product: for every query term, add its weight to each job in
+the posting list, then take the top-k with a heap.
+
+To keep query cost bounded on large corpora, stopwords and terms present
+in more than MAX_DF_RATIO of the jobs are not indexed, each posting list
+keeps only its MAX_POSTINGS highest-weighted jobs (static index pruning),
+and only the QUERY_TERMS rarest terms of a long query are scored.
+"""
+
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+
+from jobscraper import get_jobs, job_cache
+from utils import full_description
+
+K1 = 1.5
+B = 0.75
+TITLE_BOOST = 3          # title tokens count this many times
+MAX_DF_RATIO = 0.5
+QUERY_TERMS = 64
+MAX_POSTINGS = 2000
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our the to
+was we will with you your this that their they i my me am who what which
+work working team teams experience years year using used use including
+""".split())
+
+
+def tokenize(text: str) -> list:
+    """Lowercased word tokens without stopwords."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def _job_tokens(job: dict) -> list:
+    title = tokenize(job.get("title", ""))
+    return (
+        title * TITLE_BOOST
+        + tokenize(" ".join(job.get("skills", [])))
+        + tokenize(full_description(job))
+    )
+
+
+class BM25Index:
+    """
+    Sparse BM25 index over one job snapshot.
+
+    Attributes:
+        jobs:     The snapshot the index was built from.
+        postings: Term -> list of (job_id, BM25 weight of the term in that job),
+                  at most MAX_POSTINGS entries.
+        idf:      Term -> inverse document frequency.
+    """
+
+    def __init__(self, jobs: list):
+        self.jobs = jobs
+        self.postings = {}
+        self.idf = {}
+
+        docs = [Counter(_job_tokens(job)) for job in jobs]
+        n = len(docs)
+        if not n:
+            return
+        lengths = [sum(doc.values()) for doc in docs]
+        avg_len = (sum(lengths) / n) or 1.0
+
+        df = Counter()
+        for doc in docs:
+            df.update(doc.keys())
+        max_df = max(1, int(n * MAX_DF_RATIO)) if n > 10 else n
+
+        for term, count in df.items():
+            if count > max_df:
+                continue
+            self.idf[term] = math.log(1 + (n - count + 0.5) / (count + 0.5))
+            self.postings[term] = []
+
+        for job_id, doc in enumerate(docs):
+            norm = K1 * (1 - B + B * lengths[job_id] / avg_len)
+            for term, tf in doc.items():
+                idf = self.idf.get(term)
+                if idf is None:
+                    continue
+                self.postings[term].append((job_id, idf * tf * (K1 + 1) / (tf + norm)))
+
+        for term, posting in self.postings.items():
+            if len(posting) > MAX_POSTINGS:
+                self.postings[term] = heapq.nlargest(MAX_POSTINGS, posting, key=lambda entry: entry[1])
+
+    def rank(self, text: str, k: int = 10) -> list:
+        """
+        Score every job against `text` and return the best k.
+
+        Returns:
+            List of (job_id, score), best first.
+        """
+        terms = [t for t in set(tokenize(text)) if t in self.postings]
+        if len(terms) > QUERY_TERMS:
+            terms = heapq.nlargest(QUERY_TERMS, terms, key=self.idf.__getitem__)
+
+        scores = {}
+        for term in terms:
+            for job_id, weight in self.postings[term]:
+                scores[job_id] = scores.get(job_id, 0.0) + weight
+
+        best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(job_id, round(score, 4)) for job_id, score in best]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def _build_index(jobs: list) -> BM25Index:
+    global _index
+    with _index_lock:
+        if _index is None or _index.jobs is not jobs:
+            _index = BM25Index(jobs)
+        return _index
+
+
+def get_bm25_index() -> BM25Index:
+    """Return the BM25 index for the current job snapshot."""
+    jobs = get_jobs()
+    index = _index
+    if index is not None and index.jobs is jobs:
+        return index
+    return _build_index(jobs)
+
+
+def rank_jobs(text: str, k: int = 10) -> list:
+    """
+    Relevance-ranked jobs for a block of free text such as a full resume.
+
+    Returns:
+        List of dicts with title, company, location, salary, link and
+        relevance score, best first.
+    """
+    index = get_bm25_index()
+    results = []
+    for job_id, score in index.rank(text, k):
+        job = index.jobs[job_id]
+        results.append({
+            "title":     job.get("title", "Unknown"),
+            "company":   job.get("company", "Unknown"),
+            "location":  job.get("location", "Unknown"),
+            "skills":    job.get("skills", []),
+            "salary":    job.get("salary", "Competitive"),
+            "link":      job.get("link", ""),
+            "relevance": score,
+        })
+    return results
+
+
+job_cache.add_listener(_build_index)
@@ -0,0 +1,239 @@
+"""
+skills.py
+---------
+Single skill taxonomy and matcher shared by the job scraper, resume upload
+and utils.
+
+All taxonomy entries are compiled into one trie-shaped regular expression,
+so a text is scanned once no matter how many skills the taxonomy holds.
+Matches respect word boundaries, which stops "Go" or "AI" from matching
+inside other words.
+
+The SkillRegistry resolves aliases ("Node", "NodeJS", "node.js") to one
+canonical skill with an interned integer id. Jobs are normalized to
+canonical names at ingest, and indexes and counters work on the ids.
+"""
+
+import re
+import threading
+
+# ──────────────────────────────────────────────
+# Skill taxonomy
+# ──────────────────────────────────────────────
+SKILL_TAXONOMY = [
+    # Languages
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Go", "Rust",
+    "Kotlin", "Swift", "Dart", "PHP", "Ruby", "Scala", "R", "Solidity", "Bash",
+    # Web & frameworks
+    "HTML", "CSS", "React", "React Native", "Angular", "Vue", "Node.js", "Express",
+    "SpringBoot", "Django", "Flask", "REST API", "GraphQL",
+    # Data & ML
+    "SQL", "MySQL", "PostgreSQL", "MongoDB", "Redis", "Elasticsearch", "Kafka",
+    "Spark", "Hadoop", "Pandas", "NumPy", "Scikit-learn", "TensorFlow", "PyTorch",
+    "Machine Learning", "Deep Learning", "AI", "NLP", "Power BI", "Tableau", "Excel",
+    # Cloud & DevOps
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Linux", "Git", "Jenkins", "CI/CD",
+    # Mobile & design
+    "Android", "iOS", "Flutter", "Xcode", "Figma", "Selenium",
+    # Fundamentals
+    "DSA", "OOP", "System Design",
+]
+
+# Canonical skill -> other spellings that mean the same skill
+SKILL_ALIASES = {
+    "Node.js": ["Node", "NodeJS", "Node JS"],
+    "React": ["ReactJS", "React.js"],
+    "Vue": ["VueJS", "Vue.js"],
+    "Angular": ["AngularJS"],
+    "SpringBoot": ["Spring Boot"],
+    "REST API": ["REST APIs", "RESTful API", "RESTful APIs"],
+    "Go": ["Golang"],
+    "C++": ["CPP"],
+    "C#": ["CSharp"],
+    "PostgreSQL": ["Postgres"],
+    "Kubernetes": ["K8s"],
+    "Scikit-learn": ["Sklearn", "Scikit learn"],
+    "Machine Learning": ["ML"],
+    "AI": ["Artificial Intelligence"],
+    "NLP": ["Natural Language Processing"],
+    "AWS": ["Amazon Web Services"],
+    "GCP": ["Google Cloud", "Google Cloud Platform"],
+    "CI/CD": ["CICD"],
+    "Power BI": ["PowerBI"],
+}
+
+# Short names that are also common words or word fragments: these only
+# match when written exactly as in the taxonomy ("Go", not "go").
+CASE_SENSITIVE_SKILLS = {"Go", "R", "AI", "ML", "Express", "Swift", "Excel"}
+
+# A skill may not be glued to word characters or to "+"/"#" (so "C" inside
+# "C++" or "Java" inside "JavaScript" never match on their own).
+_BOUNDARY_BEFORE = r"(?<![\w+#])"
+_BOUNDARY_AFTER = r"(?![\w+#])"
+
+# Spellings this short ("R", "Go", "AI") also need list-like neighbours:
+# whitespace or list punctuation, so "R&D", "Go-to-market" or "A.I.-driven"
+# are not read as skills. A sentence stop after them counts only when it
+# ends the text or is followed by whitespace.
+SHORT_SKILL_MAX_LEN = 2
+_SHORT_BEFORE = frozenset(" \t\r\n,;:/|([{'\"•")
+_SHORT_AFTER = frozenset(" \t\r\n,;:/|)]}'\"")
+_SENTENCE_STOPS = frozenset(".!?")
+
+
+def _listed_alone(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] has list-like neighbours (see SHORT_SKILL_MAX_LEN)."""
+    if start and text[start - 1] not in _SHORT_BEFORE:
+        return False
+    if end == len(text) or text[end] in _SHORT_AFTER:
+        return True
+    return text[end] in _SENTENCE_STOPS and (end + 1 == len(text) or text[end + 1].isspace())
+
+
+def _trie_pattern(words: list) -> str:
+    """
+    Build a regex matching any of `words` (lowercase) whose alternation is
+    factored as a character trie, so the engine does at most one step per
+    character instead of trying every word at every position.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def emit(node) -> str:
+        ends_here = "" in node
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ends_here:
+            # Try the longer match first, fall back to stopping here
+            return "(?:" + body + ")?"
+        return body
+
+    return emit(trie)
+
+
+class SkillRegistry:
+    """
+    Canonical skills with interned integer ids.
+
+    Every canonical name and alias resolves (case-insensitively) to the id
+    of its canonical skill. Skills met at ingest that are not in the
+    taxonomy (e.g. job board tags) are interned on the fly.
+    """
+
+    def __init__(self, canonical: list, aliases: dict):
+        self._ids = {}          # lowercased name or alias -> id
+        self._names = []        # id -> canonical name
+        self._lock = threading.Lock()
+        for name in canonical:
+            self.intern(name)
+        for name, spellings in aliases.items():
+            skill_id = self.intern(name)
+            for spelling in spellings:
+                self._ids.setdefault(spelling.lower(), skill_id)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def intern(self, name: str) -> int:
+        """Id of `name`, registering it as a new canonical skill if unknown."""
+        key = name.strip().lower()
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(key)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    self._names.append(name.strip())
+                    self._ids[key] = skill_id
+        return skill_id
+
+    def lookup(self, name: str):
+        """Id of a known skill or alias, or None (never registers)."""
+        return self._ids.get(name.strip().lower())
+
+    def name(self, skill_id: int) -> str:
+        """Canonical name of an id."""
+        return self._names[skill_id]
+
+    def lookup_all(self, names) -> list:
+        """Ids of the known skills among `names`, deduplicated, in order."""
+        ids = (self.lookup(name) for name in names)
+        return list(dict.fromkeys(skill_id for skill_id in ids if skill_id is not None))
+
+    def intern_all(self, names) -> list:
+        """Ids of `names` (registering unknown ones), deduplicated, in order."""
+        return list(dict.fromkeys(self.intern(name) for name in names if name and name.strip()))
+
+    def canonical(self, names) -> list:
+        """Canonical spellings of `names`, deduplicated, in order."""
+        return [self._names[skill_id] for skill_id in self.intern_all(names)]
+
+    def surface_forms(self) -> dict:
+        """Lowercased spelling -> canonical name, for every name and alias."""
+        return {spelling: self._names[skill_id] for spelling, skill_id in self._ids.items()}
+
+
+class SkillMatcher:
+    """
+    Precompiled matcher over the spellings known to a SkillRegistry.
+
+    extract() returns canonical names in order of first appearance in the
+    text. Cost is one regex scan over the text, independent of taxonomy size.
+    """
+
+    def __init__(self, registry: SkillRegistry, case_sensitive: set = CASE_SENSITIVE_SKILLS):
+        self.registry = registry
+        self._canonical = registry.surface_forms()
+        self._case_sensitive = {spelling.lower(): spelling for spelling in case_sensitive}
+        self._pattern = re.compile(
+            _BOUNDARY_BEFORE + "(?:" + _trie_pattern(list(self._canonical)) + ")" + _BOUNDARY_AFTER,
+            re.IGNORECASE,
+        )
+
+    def extract(self, text: str, limit: int = None) -> list:
+        """
+        Find every taxonomy skill mentioned in `text`.
+
+        Args:
+            text:  Free text (resume, job title + description, ...).
+            limit: Optional maximum number of skills to return.
+
+        Returns:
+            Canonical skill names, deduplicated, in order of appearance.
+        """
+        found = {}
+        for match in self._pattern.finditer(text):
+            matched = match.group(0)
+            lowered = matched.lower()
+            skill = self._canonical.get(lowered)
+            if skill is None or skill in found:
+                continue
+            exact = self._case_sensitive.get(lowered)
+            if exact is not None and matched != exact:
+                continue
+            if len(matched) <= SHORT_SKILL_MAX_LEN and not _listed_alone(text, match.start(), match.end()):
+                continue
+            found[skill] = None
+            if limit and len(found) >= limit:
+                break
+        return list(found)
+
+    def extract_ids(self, text: str, limit: int = None) -> list:
+        """Like extract(), but returns skill ids."""
+        return [self.registry.lookup(skill) for skill in self.extract(text, limit)]
+
+
+# Shared instances used by all call sites
+skill_registry = SkillRegistry(SKILL_TAXONOMY, SKILL_ALIASES)
+skill_matcher = SkillMatcher(skill_registry)
+
+
+def extract_skills(text: str, limit: int = None) -> list:
+    """Extract canonical skills from text using the shared matcher."""
+    return skill_matcher.extract(text, limit)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Backend modules use script-style imports ("from skills import ...")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
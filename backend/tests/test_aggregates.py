@@ -0,0 +1,21 @@
+from aggregates import JobAggregates
+
+
+def _job(title: str, company: str, skills: list) -> dict:
+    return {"title": title, "company": company, "location": "Pune", "skills": skills}
+
+
+def test_incremental_update_matches_full_rebuild_on_ties():
+    old = [_job("Data Analyst", "Zoho", ["SQL"]), _job("QA Engineer", "TCS", ["Selenium"])]
+    new = [_job("Java Developer", "Wipro", ["Java"]), _job("QA Engineer", "TCS", ["Selenium"]),
+           _job("Android Developer", "Infosys", ["Kotlin"])]
+
+    incremental = JobAggregates(old)
+    incremental.views()
+    incremental.replace(new)
+    rebuilt = JobAggregates(new)
+
+    for view in ("trending_jobs", "hiring_companies", "demanding_skills"):
+        assert incremental.views()[view] == rebuilt.views()[view]
+    assert [entry["title"] for entry in rebuilt.views()["trending_jobs"]] == [
+        "Android Developer", "Java Developer", "QA Engineer"]
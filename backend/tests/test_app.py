@@ -0,0 +1,12 @@
+import app
+
+
+def test_warm_start_runs_once_on_the_first_request(monkeypatch):
+    calls = []
+    monkeypatch.setattr(app, "warm_start", lambda: calls.append(1))
+    monkeypatch.setattr(app, "_warm_started", False)
+
+    client = app.app.test_client()
+    client.get("/")
+    client.get("/")
+    assert calls == [1]
@@ -0,0 +1,30 @@
+from dedupe import drop_near_duplicates
+
+DESCRIPTION = ("We are hiring a senior Java developer with Spring Boot and microservices "
+               "experience to build banking platforms in Pune.")
+
+
+def test_same_title_at_different_companies_is_kept():
+    jobs = [
+        {"title": "Java Developer", "company": "Infosys", "description": ""},
+        {"title": "Java Developer", "company": "Wipro", "description": ""},
+        {"title": "Java Developer", "company": "TCS", "description": DESCRIPTION},
+        {"title": "Java Developer", "company": "HCLTech", "description": DESCRIPTION},
+    ]
+    assert drop_near_duplicates(jobs) == jobs
+
+
+def test_different_seniority_at_same_company_is_kept():
+    jobs = [
+        {"title": "Java Developer", "company": "Infosys", "description": DESCRIPTION},
+        {"title": "Senior Java Developer", "company": "Infosys", "description": DESCRIPTION},
+    ]
+    assert drop_near_duplicates(jobs) == jobs
+
+
+def test_repost_with_minor_edits_is_dropped():
+    original = {"title": "Senior Java Developer", "company": "Infosys Ltd", "description": DESCRIPTION}
+    repost = {"title": "Sr. Java Dev", "company": "Infosys",
+              "description": DESCRIPTION.replace("platforms", "apps") + " Apply now!"}
+    other_role = {"title": "Senior Python Developer", "company": "Infosys Ltd", "description": DESCRIPTION}
+    assert drop_near_duplicates([original, repost, other_role]) == [original, other_role]
@@ -0,0 +1,31 @@
+from fraud import score_jobs
+from jobscraper import _parse_adzuna_item
+
+FILLER = "We build payment products used across India and value ownership and clear writing. " * 4
+
+
+def _adzuna(description: str) -> dict:
+    return {"title": "Backend Developer", "company": {"display_name": "Acme Payments"},
+            "location": {"display_name": "Pune"}, "description": description}
+
+
+def test_scam_phrase_past_the_preview_is_flagged():
+    job = _parse_adzuna_item(_adzuna(FILLER + "A refundable deposit is collected at joining."))
+    assert "deposit" not in job["description"]
+    [scored] = score_jobs([job])
+    assert "suspicious_phrase:refundable deposit" in scored["fraud_signals"]
+
+
+def test_contact_email_comes_from_the_posting():
+    job = _parse_adzuna_item(_adzuna(FILLER + "Send your CV to acme.hiring@gmail.com."))
+    assert job["email"] == "acme.hiring@gmail.com"
+    [scored] = score_jobs([job])
+    assert "free_email_domain" in scored["fraud_signals"]
+
+
+def test_posting_without_email_raises_no_email_signal():
+    job = _parse_adzuna_item(_adzuna("Apply through the link."))
+    assert job["email"] == ""
+    assert "full_description" not in job
+    [scored] = score_jobs([job])
+    assert scored["fraud_signals"] == []
@@ -0,0 +1,53 @@
+import random
+
+import utils
+from jobindex import SCORING_MODES, JobIndex
+from skills import SKILL_TAXONOMY, skill_registry
+
+
+def test_text_filter_matches_past_the_description_preview(monkeypatch):
+    jobs = [
+        {"title": "Backend Developer", "company": "Acme", "skills": ["Java"], "description": "Build APIs..."},
+        {"title": "QA Engineer", "company": "Acme", "skills": ["Selenium"], "description": "Test releases."},
+    ]
+    monkeypatch.setattr(utils, "_full_descriptions",
+                        {("backend developer", "acme"): "Build APIs for merchants on Kafka streams."})
+    assert JobIndex(jobs).filter_ids(text="kafka") == [0]
+
+
+def _brute_force_top_k(index, skill_ids, k, scoring):
+    """Score every job one by one, the way top_k's result is specified."""
+    query = set(skill_ids)
+    scored = []
+    for job_id, job_skills in enumerate(index.job_skills):
+        job = set(job_skills)
+        common = len(job & query)
+        if not common:
+            continue
+        score = {"overlap": common,
+                 "jaccard": round(common / len(job | query), 3),
+                 "coverage": round(common / len(job), 3)}[scoring]
+        scored.append((-score, job_id))
+    return [(job_id, -neg_score) for neg_score, job_id in sorted(scored)[:k]]
+
+
+def test_top_k_matches_brute_force_scoring():
+    rng = random.Random(7)
+    skills = SKILL_TAXONOMY[:40]
+    jobs = [{"title": f"Role {i}", "company": "Acme", "skills": rng.sample(skills, rng.randint(0, 8))}
+            for i in range(600)]
+    index = JobIndex(jobs)
+    vocabulary = skill_registry.lookup_all(skills) + [10 ** 6]   # plus an id no job lists
+
+    for _ in range(100):
+        query = [rng.choice(vocabulary) for _ in range(rng.randint(0, 10))]   # duplicates included
+        k = rng.choice([0, 1, 3, 10, 50, 1000])
+        for scoring in SCORING_MODES:
+            assert index.top_k(query, k, scoring) == _brute_force_top_k(index, query, k, scoring), \
+                (query, k, scoring)
+
+
+def test_top_k_breaks_ties_by_listing_order():
+    jobs = [{"title": f"Role {i}", "company": "Acme", "skills": ["Java", "SQL"]} for i in range(5)]
+    java = skill_registry.lookup("Java")
+    assert JobIndex(jobs).top_k([java], k=3) == [(0, 1), (1, 1), (2, 1)]
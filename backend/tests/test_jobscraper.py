@@ -0,0 +1,61 @@
+import jobscraper
+import utils
+from jobscraper import _merge_jobs, _parse_adzuna_item
+
+FILLER = "We build payment products used across India and value ownership and clear writing. " * 4
+
+
+def test_full_description_is_kept_off_the_served_jobs(monkeypatch):
+    item = {"title": "Backend Developer", "company": {"display_name": "Acme Payments"},
+            "location": {"display_name": "Pune"},
+            "description": FILLER + "A refundable deposit is collected at joining."}
+    monkeypatch.setattr(jobscraper, "_live_results", {"Adzuna": [_parse_adzuna_item(item)]})
+
+    jobs, texts = _merge_jobs()
+    [job] = [job for job in jobs if job["company"] == "Acme Payments"]
+    assert "full_description" not in job
+    assert "suspicious_phrase:refundable deposit" in job["fraud_signals"]
+
+    monkeypatch.setattr(utils, "_full_descriptions", texts)
+    assert utils.full_description(job).endswith("collected at joining.")
+
+
+def test_refresh_during_an_outage_keeps_the_warm_snapshot(monkeypatch, tmp_path):
+    from jobstore import JobStore
+
+    store = JobStore(str(tmp_path / "jobs.db"))
+    live = [{"title": f"Engineer {i}", "company": f"Startup {i}", "location": "Pune", "skills": ["Java"],
+             "description": "Build things...", "source": "Adzuna"} for i in range(40)]
+    store.upsert_jobs(live, {("engineer 0", "startup 0"): FILLER})
+
+    cache = jobscraper.JobCache()
+    monkeypatch.setattr(cache, "refresh_in_background", lambda: True)
+    monkeypatch.setattr(jobscraper, "job_cache", cache)
+    monkeypatch.setattr(jobscraper, "get_store", lambda: store)
+    monkeypatch.setattr(jobscraper, "_live_results", {})
+    monkeypatch.setattr(jobscraper, "LIVE_SOURCES", [("Adzuna", lambda: []), ("RemoteOK", lambda: [])])
+    monkeypatch.setattr(utils, "_full_descriptions", {})
+
+    assert jobscraper.warm_start() == 40
+    jobscraper._refresh_jobs()              # every live source fails
+
+    titles = {job["title"] for job in cache.get()}
+    assert {job["title"] for job in live} <= titles
+    assert {job["title"] for job in live} <= {job["title"] for job in store.load_snapshot()}
+    assert store.load_full_descriptions() == {("engineer 0", "startup 0"): FILLER}
+    store.close()
+
+
+def test_merges_are_installed_under_the_results_lock(monkeypatch):
+    held = []
+    monkeypatch.setattr(jobscraper, "_install", lambda *args: held.append(jobscraper._results_lock.locked()))
+    monkeypatch.setattr(jobscraper, "_live_results", {})
+    monkeypatch.setattr(jobscraper, "LIVE_SOURCES", [("Adzuna", lambda: [])])
+
+    jobscraper._refresh_jobs()
+
+    class Done:
+        def result(self):
+            return [{"title": "Late Role", "company": "Acme", "skills": ["Java"]}]
+    jobscraper._on_late_result("Adzuna", Done())
+    assert held == [True, True]
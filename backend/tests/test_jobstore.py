@@ -0,0 +1,45 @@
+from jobstore import JobStore
+
+
+def _job(title: str, company: str, location: str, skills: list) -> dict:
+    return {"title": title, "company": company, "location": location, "skills": skills}
+
+
+def test_lookups_default_to_the_latest_snapshot(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    old = _job("Java Developer", "Infosys", "Pune", ["Java"])
+    current = [_job("Python Developer", "Infosys", "Pune", ["Python", "Java"]),
+               _job("QA Engineer", "TCS", "Pune", ["Selenium"])]
+    store.upsert_jobs([old])
+    store.upsert_jobs(current)
+
+    assert list(store.jobs_by_company("infosys")) == [current[0]]
+    assert list(store.jobs_by_location("PUNE")) == current
+    assert list(store.jobs_by_skill("java")) == [current[0]]
+
+    assert list(store.jobs_by_company("Infosys", latest_only=False)) == [current[0], old]
+    assert list(store.jobs_by_skill("Java", latest_only=False)) == [current[0], old]
+    store.close()
+
+
+def test_full_descriptions_are_stored_beside_the_job(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    job = _job("Python Developer", "Infosys", "Pune", ["Python"])
+    store.upsert_jobs([job], {("python developer", "infosys"): "Full text of the posting."})
+
+    assert store.load_snapshot() == [job]
+    assert list(store.iter_jobs()) == [job]
+    assert store.load_full_descriptions() == {("python developer", "infosys"): "Full text of the posting."}
+    store.close()
+
+
+def test_lookups_stream_without_holding_the_store_lock(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    jobs = [_job(f"Engineer {i}", "TCS", "Pune", ["Java"]) for i in range(5)]
+    store.upsert_jobs(jobs)
+
+    stream = store.jobs_by_skill("Java")
+    assert next(stream) == jobs[0]
+    store.upsert_jobs(jobs[:1])          # would block if the lookup held the lock
+    assert len(list(stream)) == 4
+    store.close()
@@ -0,0 +1,26 @@
+from flask import Flask
+
+from response_cache import json_response, serialized
+
+app = Flask(__name__)
+SOURCE = {"jobs": [{"title": "Java Developer"}]}
+
+
+@app.route("/jobs")
+def jobs():
+    return json_response(serialized("test-jobs", SOURCE))
+
+
+def test_matching_etag_gets_304_strong_or_weak():
+    client = app.test_client()
+    first = client.get("/jobs")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200 and first.get_json() == SOURCE
+
+    for header in (etag, "W/" + etag, f'"other", W/{etag}', "*"):
+        response = client.get("/jobs", headers={"If-None-Match": header})
+        assert response.status_code == 304, header
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+
+    assert client.get("/jobs", headers={"If-None-Match": '"other"'}).status_code == 200
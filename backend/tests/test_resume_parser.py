@@ -0,0 +1,15 @@
+import pytest
+
+from resume_parser import ParserPool
+
+
+def test_workers_are_not_forked_from_the_server_process():
+    pool = ParserPool(workers=1, timeout=30)
+    assert pool._ctx.get_start_method() in ("forkserver", "spawn")
+
+    # Round trip through a real worker: the parser's error comes back to the caller
+    with pytest.raises(Exception):
+        pool.parse("docx", b"not a docx")
+    worker = pool._idle.get_nowait()
+    assert worker.process.is_alive()
+    worker.kill()
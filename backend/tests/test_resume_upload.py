@@ -0,0 +1,35 @@
+import io
+import zipfile
+
+import pytest
+
+import resume_upload
+from resume_upload import expand_uploads
+
+
+def _zip(entries: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_zip_over_batch_byte_cap_is_rejected(monkeypatch):
+    monkeypatch.setattr(resume_upload, "MAX_BATCH_BYTES", 1000)
+    archive = _zip({f"resume{i}.txt": b"a" * 400 for i in range(3)})
+    with pytest.raises(ValueError, match="uncompressed"):
+        expand_uploads([("batch.zip", archive)])
+
+
+def test_batch_byte_cap_counts_plain_files_and_archives_together(monkeypatch):
+    monkeypatch.setattr(resume_upload, "MAX_BATCH_BYTES", 1000)
+    archive = _zip({"resume.txt": b"a" * 600})
+    with pytest.raises(ValueError, match="uncompressed"):
+        expand_uploads([("cv.txt", b"b" * 600), ("batch.zip", archive)])
+
+
+def test_batch_under_caps_is_expanded():
+    archive = _zip({"a.txt": b"Python", "notes/.hidden.txt": b"x", "b.png": b"x"})
+    resumes = expand_uploads([("cv.txt", b"Java"), ("batch.zip", archive)])
+    assert resumes == [("cv.txt", b"Java"), ("a.txt", b"Python")]
@@ -0,0 +1,11 @@
+from retrieval import BM25Index
+
+
+def test_terms_past_the_description_preview_are_indexed():
+    jobs = [
+        {"title": "Backend Developer", "skills": ["Java"], "description": "Build payment APIs...",
+         "full_description": "Build payment APIs for merchants. Kafka streaming pipelines."},
+        {"title": "Frontend Developer", "skills": ["React"], "description": "Build dashboards."},
+        {"title": "QA Engineer", "skills": ["Selenium"], "description": "Test releases."},
+    ]
+    assert [job_id for job_id, _ in BM25Index(jobs).rank("kafka")] == [0]
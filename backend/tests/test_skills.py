@@ -0,0 +1,10 @@
+from skills import extract_skills
+
+
+def test_short_skills_need_list_like_neighbours():
+    assert extract_skills("Lead our R&D team on a Go-to-market plan for AI-driven tools.") == []
+
+
+def test_short_skills_in_lists_and_sentences_still_match():
+    assert extract_skills("Skills: R, Go, C#/SQL. We use AI.") == ["R", "Go", "C#", "SQL", "AI"]
+    assert extract_skills("Tools:\n• R\n• Python") == ["R", "Python"]
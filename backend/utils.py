@@ -1,19 +1,62 @@
+import re
+
+from skills import skill_matcher
+
+
 def extract_skills(text):
     """
     Extracts skills from text using keyword matching.
-    Check for keywords like Python, Java, SQL, etc.
-    """
-    text = text.lower()
-    
-    known_skills = [
-        "Python", "Java", "SQL", "React", "SpringBoot", 
-        "Django", "Machine Learning", "AI", "HTML", 
-        "CSS", "JavaScript", "Pandas", "AWS", "Node.js"
-    ]
-    
-    found_skills = []
-    for skill in known_skills:
-        if skill.lower() in text:
-            found_skills.append(skill)
-            
-    return list(set(found_skills))
+    Delegates to the shared matcher in skills.py.
+    """
+    return skill_matcher.extract(text)
+
+
+# Job key -> untruncated description, for the jobs of the current snapshot
+# whose served "description" is only a preview (see jobscraper._merge_jobs)
+_full_descriptions = {}
+
+
+def set_full_descriptions(texts: dict) -> None:
+    """Replace the full-description map (job key -> text) for a new snapshot."""
+    global _full_descriptions
+    _full_descriptions = texts
+
+
+def full_description(job) -> str:
+    """
+    Untruncated description of a job: a freshly scraped job's own
+    "full_description", else the text kept aside for the current snapshot,
+    else its "description".
+    """
+    return (job.get("full_description") or _full_descriptions.get(job_key(job))
+            or job.get("description", ""))
+
+
+def job_key(job):
+    """
+    Deduplication key for a job listing: lowercased (title, company).
+    """
+    return (job.get("title", "").lower(), job.get("company", "").lower())
+
+
+_SALARY_NUMBER_RE = re.compile(r"\d[\d,]*(?:\.\d+)?\s*[kK]?")
+
+
+def parse_salary_max(salary) -> int:
+    """
+    Upper bound of a salary string such as "₹6,00,000 – ₹12,00,000 / year"
+    or "$80k - $120k" (the only bound when there is one). None if the
+    string has no number, e.g. "Competitive".
+    """
+    if not salary or not isinstance(salary, str):
+        return None
+    values = []
+    for number in _SALARY_NUMBER_RE.findall(salary):
+        number = number.strip()
+        multiplier = 1000 if number[-1] in "kK" else 1
+        digits = number.rstrip("kK").strip().replace(",", "")
+        try:
+            values.append(int(float(digits) * multiplier))
+        except ValueError:
+            continue
+    return max(values) if values else None
@@ -1,14 +1,115 @@
+"""
+verifyjob.py
+------------
+Employer email verification for job offers.
+
+Free-mail and disposable email domains are loaded once from data files
+into hash sets. An email's domain is parsed properly and checked together
+with each of its parent domains ("hr.mail.yahoo.com" -> "mail.yahoo.com"
+-> "yahoo.com"), so a lookup costs O(number of labels) set probes no
+matter how many domains are listed, and "notgmail.company.com" no longer
+matches "gmail.com".
+
+The bundled lists in data/ are seed lists (about 100 of the most common
+providers) meant for development and tests; they miss most throwaway
+domains. Production deployments are expected to point
+FREEMAIL_DOMAINS_PATH and DISPOSABLE_DOMAINS_PATH at maintained lists
+(e.g. a regularly synced copy of a public disposable-domain blocklist).
+"""
+
+import os
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+FREEMAIL_DOMAINS_PATH = os.environ.get("FREEMAIL_DOMAINS_PATH", os.path.join(_DATA_DIR, "freemail_domains.txt"))
+DISPOSABLE_DOMAINS_PATH = os.environ.get("DISPOSABLE_DOMAINS_PATH", os.path.join(_DATA_DIR, "disposable_domains.txt"))
+
+
+def load_domains(path: str) -> frozenset:
+    """Read one domain per line, ignoring blanks and '#' comments."""
+    domains = set()
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                domain = line.split("#", 1)[0].strip().lower().rstrip(".")
+                if domain:
+                    domains.add(domain)
+    except OSError as e:
+        print(f"[VerifyJob] Could not load {path}: {e}")
+    return frozenset(domains)
+
+
+def parse_email_domain(email: str):
+    """
+    Return the normalized domain of an email address, or None if the
+    address is malformed. Internationalized domains are converted to their
+    ASCII (punycode) form so they match the lists.
+    """
+    if not isinstance(email, str):
+        return None
+    email = email.strip()
+    local, sep, domain = email.rpartition("@")
+    if not sep or not local or not domain or any(c.isspace() for c in email):
+        return None
+    domain = domain.lower().rstrip(".")
+    try:
+        domain = domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        return None
+    labels = domain.split(".")
+    if len(labels) < 2 or not all(labels) or len(domain) > 253:
+        return None
+    return domain
+
+
+class DomainVerifier:
+    """Classifies email domains against free-mail and disposable lists."""
+
+    def __init__(self, freemail: frozenset, disposable: frozenset):
+        self.freemail = freemail
+        self.disposable = disposable
+
+    def _matches(self, domain: str, domains: frozenset):
+        """
+        The entry of `domains` that `domain` equals or is a subdomain of
+        ("hr.gmail.com" -> "gmail.com"), or None if there is none.
+        """
+        while True:
+            if domain in domains:
+                return domain
+            _, dot, domain = domain.partition(".")
+            if not dot:
+                return None
+
+    def check(self, email: str) -> dict:
+        """
+        Verify one email.
+
+        Returns:
+            {"status": "Safe" | "Suspicious", "reason": ..., "domain": ...}
+        """
+        domain = parse_email_domain(email)
+        if domain is None:
+            return {"status": "Suspicious", "reason": "invalid_email", "domain": None}
+        if self._matches(domain, self.disposable):
+            return {"status": "Suspicious", "reason": "disposable_domain", "domain": domain}
+        if self._matches(domain, self.freemail):
+            return {"status": "Suspicious", "reason": "free_email_domain", "domain": domain}
+        return {"status": "Safe", "reason": "company_domain", "domain": domain}
+
+
+verifier = DomainVerifier(load_domains(FREEMAIL_DOMAINS_PATH), load_domains(DISPOSABLE_DOMAINS_PATH))
+
+
 def verify(email):
     """
     Verifies if an email belongs to a generic domain.
-    If generic (gmail.com, yahoo.com, hotmail.com), return Suspicious.
-    Otherwise, return Safe.
-    """
-    suspicious_domains = ["gmail.com", "yahoo.com", "hotmail.com"]
-    
-    email_lower = email.lower()
-    for domain in suspicious_domains:
-        if domain in email_lower:
-            return {"status": "Suspicious"}
-            
-    return {"status": "Safe"}
+    If it is on a free-mail or disposable provider (or is malformed),
+    return Suspicious. Otherwise, return Safe.
+    """
+    return verifier.check(email)
+
+
+def verify_batch(emails):
+    """Verifies many emails; returns one result per email, in input order."""
+    return [verifier.check(email) for email in emails]